@@ -20,6 +20,7 @@ casa_tutorial_uvfits = os.path.join(
     DATA_PATH, "day2_TDEM0003_10s_norx_1src_1spw.uvfits"
 )
 paper_miriad_file = os.path.join(DATA_PATH, "zen.2456865.60537.xy.uvcRREAA")
+nrao_ms_file = os.path.join(DATA_PATH, "day2_TDEM0003_10s_norx_1src_1spw.ms")
 
 
 @pytest.fixture(autouse=True, scope="session")
@@ -64,6 +65,27 @@ def casa_uvfits(casa_uvfits_main):
     return
 
 
+@pytest.fixture(scope="session")
+def nrao_ms_main():
+    """Read in CASA tutorial ms file."""
+    pytest.importorskip("casacore")
+    uv_in = UVData()
+    uv_in.read(nrao_ms_file)
+
+    return uv_in
+
+
+@pytest.fixture(scope="function")
+def nrao_ms(nrao_ms_main):
+    """Make function level CASA tutorial ms object."""
+    uv_in = nrao_ms_main.copy()
+
+    yield uv_in
+
+    # cleanup
+    del uv_in
+
+
 @pytest.fixture(scope="session")
 def paper_miriad_main():
     """Read in PAPER miriad file."""
@@ -12,6 +12,15 @@ from .. import get_telescope
 
 __all__ = ["Mir"]
 
+# The SMA always has 8 antennas (all 6 meters across), so we can set up the antenna
+# metadata once here, rather than every time we read a file.
+_SMA_ANTENNA_NAMES = tuple("Ant %i" % (idx + 1) for idx in range(8))
+_SMA_ANTENNA_NUMBERS = np.arange(8)
+_SMA_ANTENNA_DIAMETERS = np.full(8, 6.0)
+
+# Only a single polarization (XX, in AIPS convention) is currently supported.
+_POL_ARRAY = np.array([-5], dtype=np.int64)
+
 
 class Mir(UVData):
     """
@@ -31,6 +40,7 @@ class Mir(UVData):
         corrchunk=None,
         pseudo_cont=False,
         flex_spw=True,
+        read_data=True,
     ):
         """
         Read in data from an SMA MIR file, and map to the UVData model.
@@ -56,6 +66,10 @@ class Mir(UVData):
             Read in only pseudo-continuuum values. Default is false.
         flex_spw : boolean
             Allow for support of multiple spectral windows. Default is true.
+        read_data : bool
+            Read in the visibility and flag data. If set to false, only the
+            metadata will be read in. Setting read_data to False results in a
+            metadata only object. Default is True.
         """
         # Use the mir_parser to read in metadata, which can be used to select data.
         mir_data = mir_parser.MirParser(filepath)
@@ -73,7 +87,6 @@ class Mir(UVData):
         if isb is None:
             isb = isb_full_list.copy()
 
-        isb_dict = {key: key in isb for key in isb_full_list}
         if len(isb) == 0:
             raise IndexError("No valid sidebands selected!")
         elif not (set(isb).issubset(set(isb_full_list))):
@@ -90,35 +103,45 @@ class Mir(UVData):
             else:
                 corrchunk = corrchunk_full_list.copy()
                 corrchunk.remove(0) if 0 in corrchunk else None
-        corrchunk_dict = {key: key in corrchunk for key in corrchunk_full_list}
 
         mir_data.use_in = mir_data.in_read["isource"] == isource
         mir_data.use_bl = np.logical_and(
             np.logical_and(
                 mir_data.bl_read["irec"] == irec, mir_data.bl_read["ipol"] == 0
             ),
-            np.array([isb_dict[key] for key in mir_data.bl_read["isb"]]),
+            np.isin(mir_data.bl_read["isb"], isb),
         )
 
-        mir_data.use_sp = np.array(
-            [corrchunk_dict[key] for key in mir_data.sp_read["corrchunk"]]
-        )
+        mir_data.use_sp = np.isin(mir_data.sp_read["corrchunk"], corrchunk)
 
         # Update the filters, and will make sure we're looking at the right metadata.
         mir_data._update_filter()
         if len(mir_data.in_data) == 0:
             raise IndexError("No valid records matching those selections!")
 
-        # Create a simple list for broadcasting values stored on a
+        # Pull out the fields we use repeatedly below into their own contiguous
+        # arrays, rather than striding through the full records every time.
+        bl_isb = np.ascontiguousarray(mir_data.bl_data["isb"])
+        sp_corrchunk = np.ascontiguousarray(mir_data.sp_data["corrchunk"])
+        sp_fsky = np.ascontiguousarray(mir_data.sp_data["fsky"])
+        sp_fres = np.ascontiguousarray(mir_data.sp_data["fres"])
+        sp_nch = np.ascontiguousarray(mir_data.sp_data["nch"])
+
+        # Create a simple array for broadcasting values stored on a
         # per-intergration basis in MIR into the (tasty) per-blt records in UVDATA.
-        bl_in_maparr = [
-            mir_data.inhid_dict[idx]
-            for idx in mir_data.bl_data["inhid"][mir_data.bl_data["isb"] == isb[0]]
-        ]
+        bl_in_maparr = mir_data.inhid_to_idx(
+            mir_data.bl_data["inhid"][bl_isb == isb[0]]
+        )
 
-        # Create a simple array/list for broadcasting values stored on a
+        # Create a simple array for broadcasting values stored on a
         # per-blt basis into per-spw records.
-        sp_bl_maparr = [mir_data.blhid_dict[idx] for idx in mir_data.sp_data["blhid"]]
+        sp_bl_maparr = mir_parser._match_keys(
+            mir_data.bl_data["blhid"], mir_data.sp_data["blhid"]
+        )
+
+        # Expand the sideband out to the per-spw records once, since we'll need it
+        # for every spectral window below.
+        sp_isb = bl_isb[sp_bl_maparr]
 
         # Different sidebands in MIR are (strangely enough) recorded as being
         # different baseline records. To be compatible w/ UVData, we just splice
@@ -130,57 +153,67 @@ class Mir(UVData):
         # to construct the frequency axis, and map the UVData spectral window ID number
         # to our weird mapping system in MIR.
         self._set_flex_spw()
-        Nfreqs = 0  # Set to zero to starts for flex_spw
 
-        # Initialize some arrays that we'll be appending to
-        flex_spw_id_array = np.array([], dtype=np.int)
-        channel_width = np.array([], dtype=np.float)
-        freq_array = np.array([], dtype=np.float)
+        # Gather up the metadata for each spectral window first, so that we know how
+        # big the frequency axis is before we start filling it in.
+        spw_fsky = np.zeros(len(corrchunk), dtype=float)
+        spw_fres = np.zeros(len(corrchunk), dtype=float)
+        spw_nchan = np.zeros(len(corrchunk), dtype=int)
+
+        # Bucket the sp records by (corrchunk, sideband) with a single sort, rather
+        # than scanning all of the records once per spectral window.
+        sb_mult = int(np.max(isb)) + 1
+        sp_key = (sp_corrchunk.astype(np.int64) * sb_mult) + sp_isb
+        spw_key = (np.asarray(corrchunk, dtype=np.int64) * sb_mult) + corrchunk_sb
+        key_order = np.argsort(sp_key, kind="stable")
+        group_start = np.searchsorted(sp_key, spw_key, side="left", sorter=key_order)
+        group_end = np.searchsorted(sp_key, spw_key, side="right", sorter=key_order)
         for idx in range(len(corrchunk)):
-            data_mask = np.logical_and(
-                mir_data.sp_data["corrchunk"] == corrchunk[idx],
-                mir_data.bl_data["isb"][sp_bl_maparr] == corrchunk_sb[idx],
-            )
+            data_idx = key_order[group_start[idx] : group_end[idx]]
 
             # Grab values, get them into appropriate types
-            spw_fsky = np.unique(mir_data.sp_data["fsky"][data_mask])
-            spw_fres = np.unique(mir_data.sp_data["fres"][data_mask])
-            spw_nchan = np.unique(mir_data.sp_data["nch"][data_mask])
+            fsky_vals = np.unique(sp_fsky[data_idx])
+            fres_vals = np.unique(sp_fres[data_idx])
+            nchan_vals = np.unique(sp_nch[data_idx])
 
             # Make sure that something weird hasn't happend with the metadata (this
             # really should never happen)
-            assert len(spw_fsky) == 1
-            assert len(spw_fres) == 1
-            assert len(spw_nchan) == 1
+            assert len(fsky_vals) == 1
+            assert len(fres_vals) == 1
+            assert len(nchan_vals) == 1
 
             #  Get the data in the right units and dtype
-            spw_fsky = np.float(spw_fsky * 1e9)  # GHz -> Hz
-            spw_fres = np.float(spw_fres * 1e6)  # MHz -> Hz
-            spw_nchan = np.int(spw_nchan)
-
-            # Tally up the number of channels
-            Nfreqs += spw_nchan
-
-            # Populate the channel width array
-            channel_width = np.append(
-                channel_width, abs(spw_fres) + np.zeros(spw_nchan, dtype=np.float)
-            )
+            spw_fsky[idx] = fsky_vals[0] * 1e9  # GHz -> Hz
+            spw_fres[idx] = fres_vals[0] * 1e6  # MHz -> Hz
+            spw_nchan[idx] = nchan_vals[0]
+
+        # Tally up the number of channels, and preallocate the frequency arrays
+        Nfreqs = int(np.sum(spw_nchan))
+        flex_spw_id_array = np.zeros(Nfreqs, dtype=int)
+        channel_width = np.zeros(Nfreqs, dtype=float)
+        freq_array = np.zeros(Nfreqs, dtype=float)
+
+        spw_end = np.cumsum(spw_nchan)
+        spw_start = spw_end - spw_nchan
+        for idx in range(len(corrchunk)):
+            spw_slice = slice(spw_start[idx], spw_end[idx])
 
-            # Populate the the spw_id_array
-            flex_spw_id_array = np.append(
-                flex_spw_id_array, idx + np.zeros(spw_nchan, dtype=np.int)
-            )
+            # Populate the channel width and spw_id arrays
+            channel_width[spw_slice] = abs(spw_fres[idx])
+            flex_spw_id_array[spw_slice] = idx
 
             # So the freq array here is a little weird, because the current fsky
             # refers to the point between the nch/2 and nch/2 + 1 channel in the
             # raw (unaveraged) spectrum. This was done for the sake of some
             # convenience, at the cost of clarity. In some future format of the
             # data, we expect to be able to drop seemingly random offset here.
-            freq_array = np.append(
-                freq_array,
-                spw_fsky
-                - (np.sign(spw_fres) * 139648437.5)
-                + (spw_fres * (np.arange(spw_nchan) + 0.5 - (spw_nchan / 2))),
+            freq_array[spw_slice] = (
+                spw_fsky[idx]
+                - (np.sign(spw_fres[idx]) * 139648437.5)
+                + (
+                    spw_fres[idx]
+                    * (np.arange(spw_nchan[idx]) + 0.5 - (spw_nchan[idx] / 2))
+                )
             )
 
         # Now assign our flexible arrays to the object itself
@@ -190,43 +223,27 @@ class Mir(UVData):
         self.channel_width = channel_width
         self.flex_spw_id_array = flex_spw_id_array
 
-        # Load up the visibilities into the MirParser object.
-        mir_data.load_data(load_vis=True, load_raw=True)
+        # Both sidebands share the same antennas, so only grab one record per blt.
+        self.ant_1_array = mir_data.bl_data["iant1"][:: 1 + dsb_spws] - 1
+        self.ant_2_array = mir_data.bl_data["iant2"][:: 1 + dsb_spws] - 1
 
         # Derive Nants_data from baselines.
-        self.Nants_data = len(
-            np.unique(
-                np.concatenate((mir_data.bl_data["iant1"], mir_data.bl_data["iant2"]))
-            )
-        )
+        self.Nants_data = len(np.union1d(self.ant_1_array, self.ant_2_array))
 
-        self.Nants_telescope = 8
+        self.Nants_telescope = len(_SMA_ANTENNA_NAMES)
         self.Nbls = int(self.Nants_data * (self.Nants_data - 1) / 2)
         self.Nblts = len(mir_data.bl_data) // (1 + dsb_spws)
         self.Npols = 1  # todo: We will need to go back and expand this.
         self.Nspws = len(corrchunk)
         self.Ntimes = len(mir_data.in_data)
-        self.ant_1_array = mir_data.bl_data["iant1"][:: 1 + dsb_spws] - 1
-        self.ant_2_array = mir_data.bl_data["iant2"][:: 1 + dsb_spws] - 1
-        self.antenna_names = [
-            "Ant 1",
-            "Ant 2",
-            "Ant 3",
-            "Ant 4",
-            "Ant 5",
-            "Ant 6",
-            "Ant 7",
-            "Ant 8",
-        ]
-        self.antenna_numbers = np.arange(8)
+        self.antenna_names = list(_SMA_ANTENNA_NAMES)
+        self.antenna_numbers = _SMA_ANTENNA_NUMBERS.copy()
 
         # Prepare the XYZ coordinates of the antenna positions.
         antXYZ = np.zeros([self.Nants_telescope, 3])
-        for idx in range(self.Nants_telescope):
-            if (idx + 1) in mir_data.antpos_data["antenna"]:
-                antXYZ[idx] = mir_data.antpos_data["xyz_pos"][
-                    mir_data.antpos_data["antenna"] == (idx + 1)
-                ]
+        ant_idx = mir_data.antpos_data["antenna"] - 1
+        ant_mask = np.logical_and(ant_idx >= 0, ant_idx < self.Nants_telescope)
+        antXYZ[ant_idx[ant_mask]] = mir_data.antpos_data["xyz_pos"][ant_mask]
 
         # Get the coordinates from the entry in telescope.py
         lat, lon, alt = get_telescope("SMA")._telescope_location.lat_lon_alt()
@@ -252,31 +269,33 @@ class Mir(UVData):
         if dsb_spws:
             self.integration_time = self.integration_time[::2]
 
+        # Convert the per-integration values first, then broadcast them out to the
+        # per-blt records, so that each conversion is only done once per integration.
         # TODO: Using MIR V3 convention, will need to be V2 compatible eventually.
-        self.lst_array = (
-            mir_data.in_data["lst"][bl_in_maparr].astype(float) + (0.0 / 3600.0)
-        ) * (np.pi / 12.0)
+        lst_in = (mir_data.in_data["lst"].astype(float) + (0.0 / 3600.0)) * (
+            np.pi / 12.0
+        )
+        self.lst_array = lst_in[bl_in_maparr]
 
         # TODO: We change between xx yy and rr ll, so we will need to update this.
-        self.polarization_array = np.asarray([-5])
+        self.polarization_array = _POL_ARRAY.copy()
 
         self.spw_array = np.arange(len(corrchunk))
 
         self.telescope_name = "SMA"
-        time_array_mjd = mir_data.in_read["mjd"][bl_in_maparr]
-        self.time_array = time_array_mjd + 2400000.5
+        time_in = mir_data.in_data["mjd"] + 2400000.5
+        self.time_array = time_in[bl_in_maparr]
 
         # Need to flip the sign convention here on uvw, since we use a1-a2 versus the
         # standard a2-a1 that uvdata expects
-        self.uvw_array = (-1.0) * np.transpose(
-            np.vstack(
-                (
-                    mir_data.bl_data["u"][:: 1 + dsb_spws],
-                    mir_data.bl_data["v"][:: 1 + dsb_spws],
-                    mir_data.bl_data["w"][:: 1 + dsb_spws],
-                )
+        uvw_array = np.column_stack(
+            (
+                mir_data.bl_data["u"][:: 1 + dsb_spws],
+                mir_data.bl_data["v"][:: 1 + dsb_spws],
+                mir_data.bl_data["w"][:: 1 + dsb_spws],
             )
         )
+        self.uvw_array = np.negative(uvw_array, out=uvw_array)
 
         # todo: Raw data is in correlation coefficients, we may want to convert to Jy.
         self.vis_units = "uncalib"
@@ -294,13 +313,25 @@ class Mir(UVData):
         self.phase_center_epoch = mir_data.in_data["epoch"][0]
 
         self.phase_center_epoch = float(self.phase_center_epoch)
-        self.antenna_diameters = np.zeros(self.Nants_telescope) + 6
+        self.antenna_diameters = _SMA_ANTENNA_DIAMETERS.copy()
         self.blt_order = ("time", "baseline")
 
+        if not read_data:
+            # Don't read in the data. This means the object is incomplete,
+            # but that may not matter for many purposes.
+            return
+
+        # Load up the visibilities into the MirParser object.
+        # Only the visibilities are needed here, so skip loading the raw data
+        mir_data.load_data(load_vis=True, load_raw=False)
+
         # TODO: Spw axis to be collapsed in future release
-        data_array = np.reshape(
-            np.concatenate(mir_data.vis_data), (self.Nblts, 1, self.Nfreqs, self.Npols),
+        # Concatenate the spectra directly into the final array, rather than making
+        # an intermediate copy that then gets reshaped.
+        data_array = np.empty(
+            (self.Nblts, 1, self.Nfreqs, self.Npols), dtype=np.complex64
         )
+        np.concatenate(mir_data.vis_data, out=data_array.reshape(-1))
 
         # Don't need the data anymore, so drop it
         mir_data.unload_data()
@@ -9,7 +9,9 @@ This module extracts data types associated with MIR files.
 """
 import numpy as np
 import os
-import copy
+from concurrent.futures import ThreadPoolExecutor
+
+from .. import _mir
 
 __all__ = ["MirParser"]
 
@@ -210,6 +212,116 @@ ac_read_dtype = np.dtype(
 
 antpos_dtype = np.dtype([("antenna", np.int16), ("xyz_pos", np.float64, 3)])
 
+in_start_dtype = np.dtype(
+    [("inhid", np.int32), ("size", np.int64), ("offset", np.int64)]
+)
+
+
+def _match_keys(parent_keys, child_keys, key_order=None):
+    """
+    Find the position of each child record key within an array of parent keys.
+
+    Parameters
+    ----------
+    parent_keys : ndarray
+        Array of unique keys (e.g., "inhid") for the parent records.
+    child_keys : ndarray
+        Array of keys for the child records, all of which must be in parent_keys.
+    key_order : ndarray of int, optional
+        Index array that sorts parent_keys, which can be supplied if already
+        calculated (e.g., when matching several sets of children to the same
+        parents). Default is to calculate it here.
+
+    Returns
+    -------
+    parent_idx : ndarray of int
+        Index into parent_keys for each entry in child_keys.
+
+    Raises
+    ------
+    KeyError
+        If any of the entries in child_keys is not found in parent_keys.
+    """
+    if len(parent_keys) == 0:
+        if len(child_keys):
+            raise KeyError("Some child records do not have a matching parent record.")
+        return np.zeros(0, dtype=np.intp)
+
+    if key_order is None:
+        key_order = np.argsort(parent_keys, kind="stable")
+    parent_idx = np.searchsorted(parent_keys, child_keys, sorter=key_order)
+    parent_idx = key_order[np.minimum(parent_idx, len(parent_keys) - 1)]
+
+    if np.any(parent_keys[parent_idx] != child_keys):
+        raise KeyError("Some child records do not have a matching parent record.")
+
+    return parent_idx
+
+
+def _memmap_records(full_filepath, dtype):
+    """
+    Map the records in a MIR metadata file into memory.
+
+    Using a memmap rather than reading in the whole file means that only the parts
+    of the file that are actually used get loaded. The map is copy-on-write, so the
+    records can be modified in memory without changing the file on disk.
+
+    Parameters
+    ----------
+    full_filepath : str
+        Path to the file to map.
+    dtype : numpy dtype
+        The dtype of the records within the file.
+
+    Returns
+    -------
+    records : ndarray of dtype
+        Array of the records in the file.
+    """
+    n_rec = os.path.getsize(full_filepath) // dtype.itemsize
+    if n_rec == 0:
+        # np.memmap doesn't support mapping empty files
+        return np.zeros(0, dtype=dtype)
+
+    return np.memmap(full_filepath, dtype=dtype, mode="c", shape=(n_rec,))
+
+
+def _group_by_inhid(inhid_arr):
+    """
+    Group records together by integration header number (inhid).
+
+    Parameters
+    ----------
+    inhid_arr : ndarray of int
+        Array of inhid values for a set of records (e.g., sp_data["inhid"]).
+
+    Returns
+    -------
+    unique_inhid : ndarray of int
+        Sorted array of the unique values in inhid_arr.
+    inhid_order : ndarray of int
+        Index array that (stably) sorts inhid_arr, such that the records for
+        unique_inhid[idx] are given by inhid_order[group_start[idx]:group_end[idx]].
+    group_start : ndarray of int
+        Start position of each group within inhid_order.
+    group_end : ndarray of int
+        End position of each group within inhid_order.
+    """
+    inhid_order = np.argsort(inhid_arr, kind="stable")
+    sorted_inhid = inhid_arr[inhid_order]
+
+    # Since the values are already sorted, each group starts wherever the inhid
+    # changes, so there's no need to sort again (as np.unique would) to find them.
+    is_start = np.ones(len(sorted_inhid), dtype=bool)
+    is_start[1:] = sorted_inhid[1:] != sorted_inhid[:-1]
+    group_start = np.flatnonzero(is_start)
+    unique_inhid = sorted_inhid[group_start]
+    group_end = np.empty_like(group_start)
+    group_end[:-1] = group_start[1:]
+    group_end[-1:] = len(inhid_order)
+
+    return unique_inhid, inhid_order, group_start, group_end
+
 
 class MirParser(object):
     """
@@ -254,24 +366,49 @@ class MirParser(object):
         self.in_start_dict = self.scan_int_start(filepath)
         self.antpos_data = self.read_antennas(filepath)
 
-        self.use_in = np.ones(self.in_read.shape, dtype=np.bool)
-        self.use_bl = np.ones(self.bl_read.shape, dtype=np.bool)
-        self.use_sp = np.ones(self.sp_read.shape, dtype=np.bool)
-
-        self.in_filter = np.ones(self.in_read.shape, dtype=np.bool)
-        self.eng_filter = np.ones(self.eng_read.shape, dtype=np.bool)
-        self.bl_filter = np.ones(self.bl_read.shape, dtype=np.bool)
-        self.sp_filter = np.ones(self.sp_read.shape, dtype=np.bool)
-        self.we_filter = np.ones(self.we_read.shape, dtype=np.bool)
-        self.ac_filter = np.ones(self.ac_read.shape, dtype=np.bool)
-
-        self.in_data = self.in_read
-        self.eng_data = self.eng_read
-        self.bl_data = self.bl_read
-        self.sp_data = self.sp_read
+        # The header keys for each record type (and therefore the parent/child
+        # relationships between them) never change, so pull the key columns out into
+        # contiguous arrays and match them up once here, rather than scanning through
+        # the full records every time the filters are updated.
+        # The in records are the parents of several record types, so only sort once.
+        in_inhid = np.ascontiguousarray(self.in_read["inhid"])
+        in_order = np.argsort(in_inhid, kind="stable")
+        bl_blhid = np.ascontiguousarray(self.bl_read["blhid"])
+        self._bl_in_idx = _match_keys(in_inhid, self.bl_read["inhid"], in_order)
+        self._sp_bl_idx = _match_keys(bl_blhid, self.sp_read["blhid"])
+        self._eng_in_idx = _match_keys(in_inhid, self.eng_read["inhid"], in_order)
+        self._we_in_idx = _match_keys(in_inhid, self.we_read["scanNumber"], in_order)
+        self._ac_in_idx = _match_keys(in_inhid, self.ac_read["inhid"], in_order)
+
+        self.use_in = np.ones(self.in_read.shape, dtype=bool)
+        self.use_bl = np.ones(self.bl_read.shape, dtype=bool)
+        self.use_sp = np.ones(self.sp_read.shape, dtype=bool)
+
+        self.in_filter = np.ones(self.in_read.shape, dtype=bool)
+        self.eng_filter = np.ones(self.eng_read.shape, dtype=bool)
+        self.bl_filter = np.ones(self.bl_read.shape, dtype=bool)
+        self.sp_filter = np.ones(self.sp_read.shape, dtype=bool)
+        self.we_filter = np.ones(self.we_read.shape, dtype=bool)
+        self.ac_filter = np.ones(self.ac_read.shape, dtype=bool)
+
+        # Index positions of the records that pass the filters for each record type
+        self.in_idx = np.arange(len(self.in_read))
+        self.eng_idx = np.arange(len(self.eng_read))
+        self.bl_idx = np.arange(len(self.bl_read))
+        self.sp_idx = np.arange(len(self.sp_read))
+        self.we_idx = np.arange(len(self.we_read))
+        self.ac_idx = np.arange(len(self.ac_read))
+
+        # The filtered records (accessed through the *_data properties) are only
+        # copied out of the *_read arrays when they are first asked for after the
+        # filters change.
+        self._in_data = None
+        self._eng_data = None
+        self._bl_data = None
+        self._sp_data = None
+        self._we_data = None
+        self._ac_data = None
         self.codes_data = self.codes_read
-        self.we_data = self.we_read
-        self.ac_data = self.ac_read
 
         # Raw data aren't loaded on start, because the datasets can be huge
         # You can force this after creating the object with load_data().
@@ -280,113 +417,265 @@ class MirParser(object):
         self.auto_data = None
         self.raw_scale_fac = None
 
-        self.inhid_dict = {}
-        self.blhid_dict = {}
-        self.sphid_dict = {}
+        # Lookups from header keys to index positions in the *_data arrays, which are
+        # built on demand (see inhid_to_idx and the *hid_dict properties below).
+        self._inhid_lookup = None
+        self._inhid_dict = None
+        self._blhid_dict = None
+        self._sphid_dict = None
+
+        # Copies of use_in, use_bl, and use_sp from the last time that the filters
+        # were updated, so that we can skip the update if nothing has changed.
+        self._last_use = None
 
         self.load_data(load_vis=load_vis, load_raw=load_raw, load_auto=load_auto)
 
+    @property
+    def in_data(self):
+        """Records from in_read that pass the current filters."""
+        if self._in_data is None:
+            self._in_data = self.in_read[self.in_idx]
+        return self._in_data
+
+    @in_data.setter
+    def in_data(self, value):
+        self._in_data = value
+
+    @property
+    def eng_data(self):
+        """Records from eng_read that pass the current filters."""
+        if self._eng_data is None:
+            self._eng_data = self.eng_read[self.eng_idx]
+        return self._eng_data
+
+    @eng_data.setter
+    def eng_data(self, value):
+        self._eng_data = value
+
+    @property
+    def bl_data(self):
+        """Records from bl_read that pass the current filters."""
+        if self._bl_data is None:
+            self._bl_data = self.bl_read[self.bl_idx]
+        return self._bl_data
+
+    @bl_data.setter
+    def bl_data(self, value):
+        self._bl_data = value
+
+    @property
+    def sp_data(self):
+        """Records from sp_read that pass the current filters."""
+        if self._sp_data is None:
+            self._sp_data = self.sp_read[self.sp_idx]
+        return self._sp_data
+
+    @sp_data.setter
+    def sp_data(self, value):
+        self._sp_data = value
+
+    @property
+    def we_data(self):
+        """Records from we_read that pass the current filters."""
+        if self._we_data is None:
+            self._we_data = self.we_read[self.we_idx]
+        return self._we_data
+
+    @we_data.setter
+    def we_data(self, value):
+        self._we_data = value
+
+    @property
+    def ac_data(self):
+        """Records from ac_read that pass the current filters."""
+        if self._ac_data is None:
+            self._ac_data = self.ac_read[self.ac_idx]
+        return self._ac_data
+
+    @ac_data.setter
+    def ac_data(self, value):
+        self._ac_data = value
+
     def _update_filter(self):
         """
         Update MirClass internal filters for the data.
 
         Expands the internal 'use_in', 'use_bl', and 'use_sp' arrays to
-        construct filters for the individual structures/data
+        construct filters for the individual structures/data. If these arrays have
+        not changed since the last time the filters were updated, this does nothing.
 
         Returns
         -------
         filter_changed : bool
             Indicates whether the underlying selected records changed.
-        """
-        old_in_filter = self.in_filter
-        old_bl_filter = self.bl_filter
-        old_sp_filter = self.sp_filter
 
-        # Start with in-level records
-        inhid_filter_dict = {
-            key: value for key, value in zip(self.in_read["inhid"], self.use_in)
-        }
+        Raises
+        ------
+        ValueError
+            If the lengths of 'use_in', 'use_bl', or 'use_sp' do not match the number
+            of in, bl, or sp records, respectively.
+        """
+        for use_arr, read_arr, name in zip(
+            (self.use_in, self.use_bl, self.use_sp),
+            (self.in_read, self.bl_read, self.sp_read),
+            ("in", "bl", "sp"),
+        ):
+            if len(use_arr) != len(read_arr):
+                raise ValueError(
+                    f"use_{name} must have the same length as {name}_read."
+                )
 
-        # Filter out de-selected bl records
-        self.bl_filter = np.logical_and(
-            self.use_bl, [inhid_filter_dict[key] for key in self.bl_read["inhid"]]
-        )
+        if self._last_use is not None and (
+            np.array_equal(self._last_use[0], self.use_in)
+            and np.array_equal(self._last_use[1], self.use_bl)
+            and np.array_equal(self._last_use[2], self.use_sp)
+        ):
+            return False
 
-        # Build a dict of bl-level records
-        blhid_filter_dict = {
-            key: value for key, value in zip(self.bl_read["blhid"], self.bl_filter)
-        }
+        self._last_use = (self.use_in.copy(), self.use_bl.copy(), self.use_sp.copy())
 
-        # Filter out de-selected sp records
-        self.sp_filter = np.logical_and(
-            self.use_sp, [blhid_filter_dict[key] for key in self.sp_read["blhid"]]
-        )
+        old_in_filter = self.in_filter
+        old_bl_filter = self.bl_filter
+        old_sp_filter = self.sp_filter
 
-        # Check for bl records that have no good sp records
-        sp_bl_check = {key: False for key in self.bl_read["blhid"]}
-        sp_bl_check.update(
-            {key: True for key in np.unique(self.sp_read["blhid"][self.sp_filter])}
+        # Propagate the selections between the in, bl, and sp records, which is done
+        # in a single compiled pass over each set of records.
+        in_filter, bl_filter, sp_filter = _mir.apply_filters(
+            np.ascontiguousarray(self.use_in, dtype=bool).view(np.uint8),
+            np.ascontiguousarray(self.use_bl, dtype=bool).view(np.uint8),
+            np.ascontiguousarray(self.use_sp, dtype=bool).view(np.uint8),
+            np.ascontiguousarray(self._bl_in_idx, dtype=np.int64),
+            np.ascontiguousarray(self._sp_bl_idx, dtype=np.int64),
         )
+        self.in_filter = in_filter.view(bool)
+        self.bl_filter = bl_filter.view(bool)
+        self.sp_filter = sp_filter.view(bool)
 
-        # Filter out de-selected bl records
-        self.bl_filter = np.logical_and(
-            self.bl_filter, [sp_bl_check[key] for key in self.bl_read["blhid"]]
-        )
+        # Filter out the last three data products, based on the above
+        self.eng_filter = self.in_filter[self._eng_in_idx]
+        self.we_filter = self.in_filter[self._we_in_idx]
+        self.ac_filter = self.in_filter[self._ac_in_idx]
 
-        # Check for in records that have no good bl records
-        bl_in_check = {key: False for key in self.in_read["inhid"]}
-        bl_in_check.update(
-            {key: True for key in np.unique(self.bl_read["inhid"][self.bl_filter])}
+        # in_filter is usually the smallest, so check it first
+        filter_changed = not (
+            np.array_equal(old_in_filter, self.in_filter)
+            and np.array_equal(old_bl_filter, self.bl_filter)
+            and np.array_equal(old_sp_filter, self.sp_filter)
         )
 
-        # Filter out de-selected in records
-        self.in_filter = np.logical_and(
-            self.use_in, [bl_in_check[key] for key in self.in_read["inhid"]]
-        )
+        if filter_changed:
+            self.in_idx = np.flatnonzero(self.in_filter)
+            self.bl_idx = np.flatnonzero(self.bl_filter)
+            self.sp_idx = np.flatnonzero(self.sp_filter)
+            self.eng_idx = np.flatnonzero(self.eng_filter)
+            self.we_idx = np.flatnonzero(self.we_filter)
+            self.ac_idx = np.flatnonzero(self.ac_filter)
+
+            # Clear out the old filtered records, which will get remade on demand
+            self._in_data = None
+            self._bl_data = None
+            self._sp_data = None
+            self._eng_data = None
+            self._we_data = None
+            self._ac_data = None
+
+            # Same goes for the key lookups
+            self._inhid_lookup = None
+            self._inhid_dict = None
+            self._blhid_dict = None
+            self._sphid_dict = None
 
-        # Create a temporary dictionary for filtering the remaining dtypes
-        inhid_filter_dict = {
-            key: value for key, value in zip(self.in_read["inhid"], self.in_filter)
-        }
+        return filter_changed
 
-        # Filter out the last two data products, based on the above
-        self.eng_filter = np.array(
-            [inhid_filter_dict[key] for key in self.eng_read["inhid"]]
-        )
-        self.we_filter = np.array(
-            [inhid_filter_dict[key] for key in self.we_read["scanNumber"]]
-        )
-        self.ac_filter = np.array(
-            [inhid_filter_dict[key] for key in self.ac_read["inhid"]]
-        )
+    def inhid_to_idx(self, inhid):
+        """
+        Find the index positions of integrations within in_data.
 
-        filter_changed = not (
-            np.all(np.array_equal(old_sp_filter, self.sp_filter))
-            and np.all(np.array_equal(old_bl_filter, self.bl_filter))
-            and np.all(np.array_equal(old_in_filter, self.in_filter))
-        )
+        Parameters
+        ----------
+        inhid : int or array_like of int
+            Integration header number(s) to look up.
 
-        if filter_changed:
-            self.in_data = self.in_read[self.in_filter]
-            self.bl_data = self.bl_read[self.bl_filter]
-            self.sp_data = self.sp_read[self.sp_filter]
-            self.eng_data = self.eng_read[self.eng_filter]
-            self.we_data = self.we_read[self.we_filter]
-            self.ac_data = self.ac_read[self.ac_filter]
-
-        # Craft some dictionaries so you know what list position matches
-        # to each index entry. This helps avoid ordering issues.
-        self.inhid_dict = {
-            self.in_data["inhid"][idx]: idx for idx in range(len(self.in_data))
-        }
-        self.blhid_dict = {
-            self.bl_data["blhid"][idx]: idx for idx in range(len(self.bl_data))
-        }
-        self.sphid_dict = {
-            self.sp_data["sphid"][idx]: idx for idx in range(len(self.sp_data))
-        }
+        Returns
+        -------
+        idx : int or ndarray of int
+            Index position(s) within in_data matching inhid, of the same shape.
 
-        return filter_changed
+        Raises
+        ------
+        KeyError
+            If any of the values in inhid are not found in in_data.
+        """
+        if self._inhid_lookup is None:
+            # Integration numbers are usually (nearly) contiguous, so a simple array
+            # where the index is the key (minus an offset) and the value is the index
+            # position in in_data is both compact and very quick to search.
+            in_inhid = self.in_read["inhid"][self.in_idx].astype(np.int64)
+            inhid_offset = in_inhid.min() if len(in_inhid) else 0
+            lookup_size = (in_inhid.max() - inhid_offset + 1) if len(in_inhid) else 0
+            if lookup_size > (4 * len(in_inhid)) + 1024:
+                # The selected inhids are too sparse for a lookup array (which could
+                # get very large), so just search through the keys instead.
+                self._inhid_lookup = (None, in_inhid)
+            else:
+                inhid_lookup = np.full(lookup_size, -1, dtype=np.int64)
+                inhid_lookup[in_inhid - inhid_offset] = np.arange(len(in_inhid))
+                self._inhid_lookup = (inhid_offset, inhid_lookup)
+
+        inhid_offset, inhid_lookup = self._inhid_lookup
+        if inhid_offset is None:
+            key_arr = np.asarray(inhid, dtype=np.int64)
+            try:
+                idx = _match_keys(inhid_lookup, key_arr.ravel()).reshape(key_arr.shape)
+            except KeyError:
+                raise KeyError("Some values of inhid are not found in in_data.")
+            return idx if idx.ndim else int(idx)
+
+        key_arr = np.asarray(inhid, dtype=np.int64) - inhid_offset
+        key_mask = (key_arr >= 0) & (key_arr < len(inhid_lookup))
+        idx = np.full(key_arr.shape, -1, dtype=np.int64)
+        idx[key_mask] = inhid_lookup[key_arr[key_mask]]
+
+        if np.any(idx < 0):
+            raise KeyError("Some values of inhid are not found in in_data.")
+
+        return idx if idx.ndim else int(idx)
+
+    @property
+    def inhid_dict(self):
+        """Dict mapping inhid to index position within in_data."""
+        if self._inhid_dict is None:
+            self._inhid_dict = dict(
+                zip(
+                    self.in_read["inhid"][self.in_idx].tolist(),
+                    range(len(self.in_idx)),
+                )
+            )
+        return self._inhid_dict
+
+    @property
+    def blhid_dict(self):
+        """Dict mapping blhid to index position within bl_data."""
+        if self._blhid_dict is None:
+            self._blhid_dict = dict(
+                zip(
+                    self.bl_read["blhid"][self.bl_idx].tolist(),
+                    range(len(self.bl_idx)),
+                )
+            )
+        return self._blhid_dict
+
+    @property
+    def sphid_dict(self):
+        """Dict mapping sphid to index position within sp_data."""
+        if self._sphid_dict is None:
+            self._sphid_dict = dict(
+                zip(
+                    self.sp_read["sphid"][self.sp_idx].tolist(),
+                    range(len(self.sp_idx)),
+                )
+            )
+        return self._sphid_dict
 
     def load_data(self, load_vis=True, load_raw=False, load_auto=False):
         """
@@ -447,7 +736,7 @@ class MirParser(object):
         ndarray
             Numpy ndarray of custom dtype of in_dtype.
         """
-        return np.fromfile(os.path.join(filepath, "in_read"), dtype=in_dtype)
+        return _memmap_records(os.path.join(filepath, "in_read"), in_dtype)
 
     @staticmethod
     def read_eng_data(filepath):
@@ -464,7 +753,7 @@ class MirParser(object):
         ndarray
             Numpy ndarray of custom dtype of eng_dtype.
         """
-        return np.fromfile(os.path.join(filepath, "eng_read"), dtype=eng_dtype)
+        return _memmap_records(os.path.join(filepath, "eng_read"), eng_dtype)
 
     @staticmethod
     def read_bl_data(filepath):
@@ -481,7 +770,7 @@ class MirParser(object):
         ndarray
             Numpy ndarray of custom dtype of bl_dtype.
         """
-        return np.fromfile(os.path.join(filepath, "bl_read"), dtype=bl_dtype)
+        return _memmap_records(os.path.join(filepath, "bl_read"), bl_dtype)
 
     @staticmethod
     def read_sp_data(filepath):
@@ -498,7 +787,7 @@ class MirParser(object):
         ndarray
             Numpy ndarray of custom dtype of sp_dtype.
         """
-        return np.fromfile(os.path.join(filepath, "sp_read"), dtype=sp_dtype)
+        return _memmap_records(os.path.join(filepath, "sp_read"), sp_dtype)
 
     @staticmethod
     def read_codes_data(filepath):
@@ -515,7 +804,7 @@ class MirParser(object):
         ndarray
             Numpy ndarray of custom dtype of codes_dtype.
         """
-        return np.fromfile(os.path.join(filepath, "codes_read"), dtype=codes_dtype)
+        return _memmap_records(os.path.join(filepath, "codes_read"), codes_dtype)
 
     @staticmethod
     def read_we_data(filepath):
@@ -532,7 +821,7 @@ class MirParser(object):
         ndarray
             Numpy ndarray of custom dtype of we_dtype.
         """
-        return np.fromfile(os.path.join(filepath, "we_read"), dtype=we_dtype)
+        return _memmap_records(os.path.join(filepath, "we_read"), we_dtype)
 
     @staticmethod
     def read_antennas(filepath):
@@ -549,22 +838,20 @@ class MirParser(object):
         antpos_data : ndarray
             Numpy ndarray of custom dtype of antpos_dtype.
         """
-        with open(os.path.join(filepath, "antennas"), "r") as antennas_file:
-            temp_list = [
-                item for line in antennas_file.readlines() for item in line.split()
-            ]
-        antpos_data = np.empty(len(temp_list) // 4, dtype=antpos_dtype)
-        antpos_data["antenna"] = np.int16(temp_list[0::4])
-        antpos_data["xyz_pos"] = np.array(
-            [temp_list[1::4], temp_list[2::4], temp_list[3::4]], dtype=np.float64
-        ).T
+        # Each line of the file is the antenna number followed by the x, y, z position
+        temp_arr = np.loadtxt(
+            os.path.join(filepath, "antennas"), dtype=np.float64, ndmin=2
+        )
+        antpos_data = np.empty(len(temp_arr), dtype=antpos_dtype)
+        antpos_data["antenna"] = temp_arr[:, 0].astype(np.int16)
+        antpos_data["xyz_pos"] = temp_arr[:, 1:4]
 
         return antpos_data
 
     @staticmethod
     def scan_int_start(filepath):
         """
-        Read "sch_read" mir file into a python dictionary (@staticmethod).
+        Find the location of each integration record in "sch_read" (@staticmethod).
 
         Parameters
         ----------
@@ -573,30 +860,27 @@ class MirParser(object):
 
         Returns
         -------
-        dict
-            Dictionary containing the indexes from sch_read.
+        in_start_dict : ndarray of in_start_dtype
+            Array containing the inhid, size (in bytes, including the header), and
+            position within the file of each integration record in sch_read, sorted
+            by inhid.
         """
         full_filepath = os.path.join(filepath, "sch_read")
-        file_size = os.path.getsize(full_filepath)
-        with open(full_filepath, "rb") as visibilities_file:
-            data_offset = 0
-            last_offset = 0
-            in_offset_dict = {}
-            while data_offset < file_size:
-                int_vals = np.fromfile(
-                    visibilities_file,
-                    dtype=np.dtype([("inhid", np.int32), ("insize", np.int32)]),
-                    count=1,
-                    offset=last_offset,
-                )
-                in_offset_dict[int_vals["inhid"][0]] = (
-                    int_vals["insize"][0] + 8,
-                    data_offset,
-                )
-                last_offset = int_vals["insize"][0]
-                data_offset += last_offset + 8
+        if os.path.getsize(full_filepath) == 0:
+            return np.zeros(0, dtype=in_start_dtype)
+
+        # Walk through the record headers w/ the compiled scanner, which avoids
+        # going back to the file for every single record.
+        inhid_arr, insize_arr, offset_arr = _mir.scan_int_headers(
+            np.memmap(full_filepath, dtype=np.uint8, mode="r")
+        )
+
+        in_start_dict = np.zeros(len(inhid_arr), dtype=in_start_dtype)
+        in_start_dict["inhid"] = inhid_arr
+        in_start_dict["size"] = insize_arr + 8
+        in_start_dict["offset"] = offset_arr
 
-        return in_offset_dict
+        return in_start_dict[np.argsort(inhid_arr, kind="stable")]
 
     @staticmethod
     def scan_auto_data(filepath, nchunks=8):
@@ -618,49 +902,45 @@ class MirParser(object):
         """
         full_filepath = os.path.join(filepath, "autoCorrelations")
         file_size = os.path.getsize(full_filepath)
-        with open(full_filepath, "rb") as auto_file:
-            data_offset = 0
-            last_offset = 0
-            acfile_dtype = np.dtype(
-                [
-                    ("antenna", np.int32),
-                    ("nChunks", np.int32),
-                    ("scan", np.int32),
-                    ("dhrs", np.float64),
-                ]
+
+        # Each record is a 20-byte header, followed by the spectra for each chunk
+        def _rec_size(nchunks):
+            return 4 * (2 ** 14) * int(nchunks) * 2 + 20
+
+        # This bit of code is to trap an unfortunately common problem with metadata
+        # of MIR autos not being correctly recorded.
+        if (file_size % _rec_size(nchunks)) != 0:
+            nchunks = int(
+                np.fromfile(full_filepath, dtype=np.int32, count=2, offset=0)[1]
             )
-            marker = 0
-            while data_offset < file_size:
-                auto_vals = np.fromfile(
-                    auto_file, dtype=acfile_dtype, count=1, offset=last_offset
-                )
-                # This bit of code is to trap an unfortunately
-                # common problem with metadata of MIR autos not
-                # being correctly recorded.
-                if data_offset == 0:
-                    if (file_size % (4 * (2 ** 14) * nchunks * 2 + 20)) != 0:
-                        nchunks = int(auto_vals["nChunks"][0])
-                        if (file_size % (4 * (2 ** 14) * nchunks * 2 + 20)) != 0:
-                            raise IndexError(
-                                "Could not determine auto-correlation record size!"
-                            )
-                    # How big the record is for each data set
-                    last_offset = 4 * (2 ** 14) * int(nchunks) * 2
-                    ac_data = np.zeros(
-                        file_size // ((4 * (2 ** 14) * int(nchunks) * 2 + 20)),
-                        dtype=ac_read_dtype,
-                    )
-                ac_data[marker] = (
-                    auto_vals["scan"][0],
-                    marker + 1,
-                    auto_vals["antenna"][0],
-                    nchunks,
-                    last_offset + 20,
-                    data_offset,
-                    auto_vals["dhrs"][0],
-                )
-                data_offset += last_offset + 20
-                marker += 1
+            if (file_size % _rec_size(nchunks)) != 0:
+                raise IndexError("Could not determine auto-correlation record size!")
+
+        # Since the records are all the same size, we can read all of the headers at
+        # once with a memmap, treating everything past the header as padding.
+        rec_size = _rec_size(nchunks)
+        acfile_dtype = np.dtype(
+            {
+                "names": ["antenna", "nChunks", "scan", "dhrs"],
+                "formats": [np.int32, np.int32, np.int32, np.float64],
+                "offsets": [0, 4, 8, 12],
+                "itemsize": rec_size,
+            }
+        )
+        n_rec = file_size // rec_size
+        ac_data = np.zeros(n_rec, dtype=ac_read_dtype)
+        if n_rec == 0:
+            return ac_data
+
+        auto_vals = np.memmap(full_filepath, dtype=acfile_dtype, mode="r")
+        ac_data["inhid"] = auto_vals["scan"]
+        ac_data["achid"] = np.arange(1, n_rec + 1)
+        ac_data["antenna"] = auto_vals["antenna"]
+        ac_data["nchunks"] = nchunks
+        ac_data["datasize"] = rec_size
+        ac_data["dataoff"] = np.arange(n_rec, dtype=np.int64) * rec_size
+        ac_data["dhrs"] = auto_vals["dhrs"]
+
         return ac_data
 
     @staticmethod
@@ -672,9 +952,9 @@ class MirParser(object):
         ----------
         filepath : str
             Path to the folder containing the mir data set.
-        in_start_dict: dict of tuples
-            Dictionary returned from scan_int_start, which records position and
-            record size for each integration
+        in_start_dict : ndarray of in_start_dtype
+            Array returned from scan_int_start, which records position and
+            record size for each integration.
         sp_data : ndarray of sp_data_type
             Array from "sp_read", returned by "read_sp_read".
 
@@ -686,40 +966,27 @@ class MirParser(object):
         """
         # Gather the needed metadata
         inhid_arr = sp_data["inhid"]
-        nch_arr = sp_data["nch"]
-        dataoff_arr = sp_data["dataoff"] // 2
-        sp_pos = np.arange(len(dataoff_arr))
+        nch_arr = sp_data["nch"].astype(np.int64)
+        dataoff_arr = sp_data["dataoff"].astype(np.int64) // 2
 
-        unique_inhid = np.unique(inhid_arr)
-        unique_nch = np.unique(nch_arr)
+        unique_inhid, inhid_order, group_start, group_end = _group_by_inhid(inhid_arr)
+        int_data_dict = MirParser.read_vis_data(
+            filepath, in_start_dict[_match_keys(in_start_dict["inhid"], unique_inhid)]
+        )
         vis_list = []
-        sp_pos_list = []
-        for inhid in unique_inhid:
-            packdata = MirParser.read_vis_data(filepath, {inhid: in_start_dict[inhid]})[
-                inhid
-            ]["packdata"]
-            data_mask = inhid_arr == inhid
-            dataoff_subarr = dataoff_arr[data_mask]
-            nch_subarr = nch_arr[data_mask]
-            sp_pos_subarr = sp_pos[data_mask]
-            scale_fac = np.power(2.0, packdata[dataoff_subarr], dtype=np.float32)
-            for spec_size in unique_nch:
-                start_list = dataoff_subarr[spec_size == nch_subarr] + 1
-                end_list = start_list + (spec_size * 2)
-                temp_data = np.multiply(
-                    scale_fac[spec_size == nch_subarr, None],
-                    np.array(
-                        [packdata[idx:jdx] for idx, jdx in zip(start_list, end_list)]
-                    ),
-                    dtype=np.float32,
-                ).view(dtype=np.complex64)
-                vis_list.extend([temp_data[idx, :] for idx in range(len(start_list))])
-                # Record where the data _should_ go in the list
-                sp_pos_list.extend(sp_pos_subarr[spec_size == nch_subarr])
-        # Do a bit of order swapping so that things match with sp_read
-        sp_pos_dict = {sp_pos_list[idx]: idx for idx in range(len(sp_pos_list))}
-        vis_list = [vis_list[sp_pos_dict[idx]] for idx in range(len(sp_pos_list))]
-        return vis_list
+        for inhid, start, end in zip(unique_inhid, group_start, group_end):
+            packdata = int_data_dict[inhid]["packdata"]
+            data_idx = inhid_order[start:end]
+            dataoff_subarr = dataoff_arr[data_idx]
+            nch_subarr = nch_arr[data_idx]
+            # Unpack all of the spectra for this integration in one go, and then
+            # split them back out into the individual spectra (as views).
+            temp_data = _mir.unpack_vis(packdata, dataoff_subarr, nch_subarr)
+            vis_list.extend(np.split(temp_data, np.cumsum(nch_subarr)[:-1]))
+        # Do a bit of order swapping so that things match with sp_read (vis_list is
+        # currently in the order given by inhid_order).
+        sp_order = np.argsort(inhid_order)
+        return [vis_list[idx] for idx in sp_order.tolist()]
 
     @staticmethod
     def parse_raw_data(filepath, in_start_dict, sp_data):
@@ -733,9 +1000,9 @@ class MirParser(object):
         ----------
         filepath : str
             Path to the folder containing the mir data set.
-        in_start_dict: dict of tuples
-            Dictionary returned from scan_int_start, which records position and
-            record size for each integration
+        in_start_dict : ndarray of in_start_dtype
+            Array returned from scan_int_start, which records position and
+            record size for each integration.
         sp_data : ndarray of sp_data_type
             Array from "sp_read", returned by "read_sp_read".
 
@@ -750,30 +1017,37 @@ class MirParser(object):
         """
         # Gather the needed metadata
         inhid_arr = sp_data["inhid"]
-        nch_arr = sp_data["nch"].astype(np.int)
+        # nch is stored as int16, which would overflow when doubled below for the
+        # full-resolution (16384 channel) spectra, so upcast it here.
+        nch_arr = sp_data["nch"].astype(np.int64)
         dataoff_arr = sp_data["dataoff"] // 2
 
-        unique_inhid = np.unique(inhid_arr)
+        unique_inhid, inhid_order, group_start, group_end = _group_by_inhid(inhid_arr)
+        int_data_dict = MirParser.read_vis_data(
+            filepath, in_start_dict[_match_keys(in_start_dict["inhid"], unique_inhid)]
+        )
         vis_list = []
         scale_fac_list = []
-        for inhid in unique_inhid:
-            packdata = MirParser.read_vis_data(filepath, {inhid: in_start_dict[inhid]})[
-                inhid
-            ]["packdata"]
-            data_mask = inhid_arr == inhid
-            dataoff_subarr = dataoff_arr[data_mask]
-            nch_subarr = nch_arr[data_mask]
-            scale_fac_list += copy.deepcopy(packdata[dataoff_subarr]).tolist()
+        for inhid, start, end in zip(unique_inhid, group_start, group_end):
+            packdata = int_data_dict[inhid]["packdata"]
+            data_idx = inhid_order[start:end]
+            dataoff_subarr = dataoff_arr[data_idx]
+            nch_subarr = nch_arr[data_idx]
+            scale_fac_list += packdata[dataoff_subarr].tolist()
             start_list = dataoff_subarr + 1
-            end_list = start_list + (nch_subarr * 2)
-            vis_list += [
-                copy.deepcopy(packdata[idx:jdx])
-                for idx, jdx in zip(start_list, end_list)
-            ]
+            raw_sublist = [None] * len(start_list)
+            # All spectra w/ the same number of channels can be grabbed in a single
+            # gather, which makes a new (contiguous) array for each spectrum.
+            for spec_size in np.unique(nch_subarr):
+                nch_idx = np.flatnonzero(nch_subarr == spec_size)
+                gather_idx = start_list[nch_idx, None] + np.arange(2 * spec_size)
+                for idx, raw_data in zip(nch_idx, packdata[gather_idx]):
+                    raw_sublist[idx] = raw_data
+            vis_list += raw_sublist
         return vis_list, scale_fac_list
 
     @staticmethod
-    def read_auto_data(filepath, ac_data, winsel=None):
+    def read_auto_data(filepath, ac_data, winsel=None, n_threads=4):
         """
         Read "autoCorrelations" mir file into memory (@staticmethod).
 
@@ -788,6 +1062,8 @@ class MirParser(object):
             Structure from returned from scan_auto_data.
         winsel : list of int (optional)
             List of spectral windows to include.
+        n_threads : int (optional)
+            Number of threads to use for reading in the records (default is 4).
 
         Returns
         -------
@@ -806,21 +1082,67 @@ class MirParser(object):
         # TODO: Allow this to be flexible if dealing w/ spectrally averaged data
         # (although it's only use currently is in its unaveraged formal for
         # normaliztion of the crosses)
-        auto_data = np.empty((len(ac_data), len(winsel), 2, 2 ** 14), dtype=np.float32)
+        if len(ac_data) == 0:
+            return np.empty((0, len(winsel), 2, 2 ** 14), dtype=np.float32)
+
         dataoff = ac_data["dataoff"]
         datasize = ac_data["datasize"]
-        del_offset = np.insert(np.diff(dataoff) - datasize[0:-1], 0, dataoff[0])
-        nvals = ac_data["nchunks"] * 2 * (2 ** 14)
         nchunks = ac_data["nchunks"]
 
-        with open(os.path.join(filepath, "autoCorrelations"), "rb") as auto_file:
-            for idx in range(len(dataoff)):
-                auto_data[idx] = np.fromfile(
-                    auto_file,
-                    dtype=np.float32,
-                    count=nvals[idx],
-                    offset=20 + del_offset[idx],
-                ).reshape((nchunks[idx], 2, 2 ** 14))[winsel, :, :]
+        auto_mmap = np.memmap(
+            os.path.join(filepath, "autoCorrelations"), dtype=np.uint8, mode="r"
+        )
+        auto_data = np.empty((len(ac_data), len(winsel), 2, 2 ** 14), dtype=np.float32)
+
+        if (
+            np.all(datasize == datasize[0])
+            and np.all(nchunks == nchunks[0])
+            and np.all((dataoff % datasize[0]) == 0)
+        ):
+            # Usual case: all records are the same size, so we can treat the file as
+            # one big array of records, and grab them with a gather.
+            auto_dtype = np.dtype(
+                {
+                    "names": ["data"],
+                    "formats": [(np.float32, (nchunks[0], 2, 2 ** 14))],
+                    "offsets": [20],
+                    "itemsize": int(datasize[0]),
+                }
+            )
+            auto_recs = np.frombuffer(
+                auto_mmap, dtype=auto_dtype, count=len(auto_mmap) // int(datasize[0]),
+            )["data"]
+            rec_idx = dataoff // datasize[0]
+
+            def _copy_records(rec_slice):
+                auto_data[rec_slice] = auto_recs[rec_idx[rec_slice, None], winsel]
+
+        else:
+            nvals = nchunks * 2 * (2 ** 14)
+
+            def _copy_records(rec_slice):
+                for idx in range(rec_slice.start, rec_slice.stop):
+                    auto_data[idx] = np.frombuffer(
+                        auto_mmap,
+                        dtype=np.float32,
+                        count=nvals[idx],
+                        offset=20 + int(dataoff[idx]),
+                    ).reshape((nchunks[idx], 2, 2 ** 14))[winsel, :, :]
+
+        # Split the records up between several threads. Numpy releases the GIL while
+        # copying, so the threads can overlap with each other while pages of the file
+        # are being read in from disk.
+        n_threads = max(1, min(int(n_threads), len(ac_data)))
+        rec_bounds = np.linspace(0, len(ac_data), n_threads + 1).astype(int)
+        rec_slices = [
+            slice(start, stop) for start, stop in zip(rec_bounds[:-1], rec_bounds[1:])
+        ]
+        if n_threads == 1:
+            _copy_records(rec_slices[0])
+        else:
+            with ThreadPoolExecutor(max_workers=n_threads) as executor:
+                # Calling list here makes sure any errors get raised
+                list(executor.map(_copy_records, rec_slices))
 
         return auto_data
 
@@ -833,22 +1155,22 @@ class MirParser(object):
         ----------
         filepath : str
             filepath is the path to the folder containing the mir data set.
-        in_start_dict : dict
-            indexes to the visibility locations within the file.
+        in_start_dict : ndarray of in_start_dtype
+            Array (or subset thereof) returned from scan_int_start, which records the
+            position and size of each integration record within the file.
 
         Returns
         -------
         in_data_dict : dict
             Dictionary of the data, where the keys are inhid and the values are
-            the 'raw' block of values recorded in "sch_read" for that inhid.
+            the 'raw' block of values recorded in "sch_read" for that inhid. Note
+            that the values are read-only views into a memory map of the file.
         """
-        in_data_dict = {}
-        in_dtype_dict = {}
-        size_list = np.unique(
-            [in_start_dict[ind_key][0] for ind_key in in_start_dict.keys()]
-        )
+        if len(in_start_dict) == 0:
+            return {}
 
-        for in_size in size_list:
+        in_dtype_dict = {}
+        for in_size in np.unique(in_start_dict["size"]):
             in_dtype_dict[in_size] = np.dtype(
                 [
                     ("inhid", np.int32),
@@ -857,44 +1179,19 @@ class MirParser(object):
                 ]
             )
 
-        inhid_list = []
-        with open(os.path.join(filepath, "sch_read"), "rb") as visibilities_file:
-            last_offset = last_size = num_vals = del_offset = 0
-            key_list = sorted(in_start_dict.keys())
-            # We add an extra key here, None, which cannot match any of the values in
-            # in_start_dict (since inhid is type int). This basically tricks the loop
-            # below into spitting out the last integration
-            key_list.append(None)
-            for ind_key in key_list:
-                if ind_key is None:
-                    in_size = in_start = 0
-                else:
-                    (in_size, in_start) = in_start_dict[ind_key]
-                if (in_size != last_size) or (
-                    last_offset + last_size * num_vals != in_start
-                ):
-                    # Numpy's fromfile works fastest when reading multiple instances
-                    # of the same dtype. As long as the record sizes are the same, we
-                    # can tie mutiple file reads together into one call. The dtype
-                    # depends on the record size, which is why we have to dump the
-                    # data when last_size changes.
-                    if num_vals != 0 and last_size != 0:
-                        in_data_dict.update(
-                            zip(
-                                inhid_list,
-                                np.fromfile(
-                                    visibilities_file,
-                                    dtype=in_dtype_dict[last_size],
-                                    count=num_vals,
-                                    offset=del_offset,
-                                ).copy(),
-                            )
-                        )
-                    del_offset = in_start - (last_offset + (num_vals * last_size))
-                    last_offset = in_start
-                    last_size = in_size
-                    num_vals = 0
-                    inhid_list = []
-                num_vals += 1
-                inhid_list.append(ind_key)
+        # Map the file into memory and let the OS handle paging in the records as
+        # they are needed, rather than issuing separate reads for each integration.
+        vis_mmap = np.memmap(
+            os.path.join(filepath, "sch_read"), dtype=np.uint8, mode="r"
+        )
+        in_data_dict = {
+            inhid: np.frombuffer(
+                vis_mmap, dtype=in_dtype_dict[in_size], count=1, offset=in_start
+            )[0]
+            for inhid, in_size, in_start in zip(
+                in_start_dict["inhid"].tolist(),
+                in_start_dict["size"].tolist(),
+                in_start_dict["offset"].tolist(),
+            )
+        }
         return in_data_dict
@@ -0,0 +1,265 @@
+# -*- mode: python; coding: utf-8 -*-
+# Copyright (c) 2020 Radio Astronomy Software Group
+# Licensed under the 2-clause BSD License
+
+# distutils: language = c
+# cython: linetrace=True
+# distutils: define_macros=CYTHON_TRACE_NOGIL=1
+# python imports
+import numpy as np
+# cython imports
+cimport cython
+cimport numpy
+from libc.string cimport memcpy
+
+# ldexpf is not included in the libc.math declarations shipped with older versions
+# of cython, so declare it here directly.
+cdef extern from "math.h" nogil:
+  float ldexpf(float x, int exp)
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cpdef numpy.ndarray[ndim=1, dtype=numpy.complex64_t] unpack_vis(
+  const numpy.int16_t[::1] packdata,
+  const numpy.int64_t[::1] dataoff,
+  const numpy.int64_t[::1] nch,
+):
+  """
+  Convert packed MIR spectra into floating-point visibilities.
+
+  Each spectrum in packdata is stored as a single int16 scale exponent (at the
+  position given in dataoff), followed by nch pairs of int16 real and imaginary
+  values, which need to be multiplied by 2 ** exponent.
+
+  Parameters
+  ----------
+  packdata : ndarray of int16
+    The raw block of values recorded in "sch_read" for a single integration.
+  dataoff : ndarray of int64
+    Position of each spectrum within packdata, in units of int16 values.
+  nch : ndarray of int64
+    Number of channels in each spectrum.
+
+  Returns
+  -------
+  vis_data : ndarray of complex64
+    The spectra, concatenated in the order in which they were listed in dataoff.
+
+  Raises
+  ------
+  ValueError
+    If dataoff and nch have different lengths.
+  IndexError
+    If any of the spectra fall outside of packdata.
+  """
+  cdef Py_ssize_t nspec = dataoff.shape[0]
+  cdef Py_ssize_t npack = packdata.shape[0]
+  cdef Py_ssize_t i, j, start, out_start
+  cdef bint out_of_bounds = False
+
+  if nch.shape[0] != nspec:
+    raise ValueError("dataoff and nch must have the same length.")
+
+  # Bounds checking is turned off in the loop below, so make sure that every spectrum
+  # (the scale exponent plus 2 * nch values) sits inside of packdata first.
+  with nogil:
+    for i in range(nspec):
+      if (dataoff[i] < 0) or (nch[i] < 0) or (dataoff[i] + 1 + 2 * nch[i] > npack):
+        out_of_bounds = True
+        break
+
+  if out_of_bounds:
+    raise IndexError("Some spectra extend past the end of the integration record.")
+
+  cdef int scale_exp
+  cdef float scale_fac
+  cdef numpy.ndarray[ndim=1, dtype=numpy.float32_t] vis_data = np.empty(
+    2 * np.sum(nch), dtype=np.float32
+  )
+  # make views as c-contiguous arrays of a known dtype
+  # effectivly turns the numpy array into a c-array
+  cdef numpy.float32_t[::1] _vis = vis_data
+
+  out_start = 0
+  with nogil:
+    for i in range(nspec):
+      scale_exp = packdata[dataoff[i]]
+      start = dataoff[i] + 1
+      # Calculate 2 ** scale_exp once per spectrum (rather than calling ldexpf for
+      # every value), which also matches how the scaling was done in numpy, including
+      # the exponents where the scale factor under- or overflows.
+      scale_fac = ldexpf(1.0, scale_exp)
+      for j in range(2 * nch[i]):
+        _vis[out_start + j] = scale_fac * (<float> packdata[start + j])
+      out_start += 2 * nch[i]
+
+  return vis_data.view(np.complex64)
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cpdef tuple scan_int_headers(const unsigned char[::1] filedata):
+  """
+  Find the position and size of each integration record in a MIR "sch_read" file.
+
+  Each record starts with an 8-byte header, made up of the int32 integration header
+  number (inhid) and the int32 size of the record (in bytes) that follows.
+
+  Parameters
+  ----------
+  filedata : ndarray of uint8
+    The full contents of the "sch_read" file (typically as a memmap).
+
+  Returns
+  -------
+  inhid : ndarray of int32
+    Integration header number for each record.
+  insize : ndarray of int64
+    Size of each record in bytes, not including the 8-byte header.
+  offset : ndarray of int64
+    Position of the start of each record (including the header) within the file.
+  """
+  cdef Py_ssize_t nbytes = filedata.shape[0]
+  cdef Py_ssize_t pos, nrec, idx
+  cdef numpy.int32_t header[2]
+  cdef bint bad_size = False
+
+  # Walk through the headers once to count the records, then again to fill the
+  # output arrays (the headers are tiny, so this is much cheaper than the data).
+  pos = 0
+  nrec = 0
+  with nogil:
+    while pos + 8 <= nbytes:
+      memcpy(header, &filedata[pos], 8)
+      if header[1] < 0:
+        bad_size = True
+        break
+      pos += header[1] + 8
+      nrec += 1
+
+  if bad_size:
+    raise ValueError("Found a record with a negative size in sch_read.")
+
+  cdef numpy.ndarray[ndim=1, dtype=numpy.int32_t] inhid = np.empty(
+    nrec, dtype=np.int32
+  )
+  cdef numpy.ndarray[ndim=1, dtype=numpy.int64_t] insize = np.empty(
+    nrec, dtype=np.int64
+  )
+  cdef numpy.ndarray[ndim=1, dtype=numpy.int64_t] offset = np.empty(
+    nrec, dtype=np.int64
+  )
+  cdef numpy.int32_t[::1] _inhid = inhid
+  cdef numpy.int64_t[::1] _insize = insize
+  cdef numpy.int64_t[::1] _offset = offset
+
+  pos = 0
+  with nogil:
+    for idx in range(nrec):
+      memcpy(header, &filedata[pos], 8)
+      _inhid[idx] = header[0]
+      _insize[idx] = header[1]
+      _offset[idx] = pos
+      pos += header[1] + 8
+
+  return inhid, insize, offset
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cpdef tuple apply_filters(
+  const numpy.uint8_t[::1] use_in,
+  const numpy.uint8_t[::1] use_bl,
+  const numpy.uint8_t[::1] use_sp,
+  const numpy.int64_t[::1] bl_in_idx,
+  const numpy.int64_t[::1] sp_bl_idx,
+):
+  """
+  Propagate the MIR record selections between the in, bl, and sp records.
+
+  A bl record is only selected if its parent in record and at least one of its
+  child sp records are selected, an sp record is only selected if its parent bl record
+  is selected, and an in record is only selected if at least one of its child bl
+  records is selected.
+
+  Parameters
+  ----------
+  use_in : ndarray of uint8
+    Selection mask (0 or 1) for the in records.
+  use_bl : ndarray of uint8
+    Selection mask (0 or 1) for the bl records.
+  use_sp : ndarray of uint8
+    Selection mask (0 or 1) for the sp records.
+  bl_in_idx : ndarray of int64
+    Index of the parent in record for each bl record.
+  sp_bl_idx : ndarray of int64
+    Index of the parent bl record for each sp record.
+
+  Returns
+  -------
+  in_filter : ndarray of uint8
+    Filter (0 or 1) for the in records.
+  bl_filter : ndarray of uint8
+    Filter (0 or 1) for the bl records.
+  sp_filter : ndarray of uint8
+    Filter (0 or 1) for the sp records.
+
+  Raises
+  ------
+  ValueError
+    If use_bl and bl_in_idx, or use_sp and sp_bl_idx, have different lengths.
+  """
+  cdef Py_ssize_t n_in = use_in.shape[0]
+  cdef Py_ssize_t n_bl = use_bl.shape[0]
+  cdef Py_ssize_t n_sp = use_sp.shape[0]
+  cdef Py_ssize_t idx
+
+  if bl_in_idx.shape[0] != n_bl:
+    raise ValueError("use_bl and bl_in_idx must have the same length.")
+  if sp_bl_idx.shape[0] != n_sp:
+    raise ValueError("use_sp and sp_bl_idx must have the same length.")
+
+  cdef numpy.ndarray[ndim=1, dtype=numpy.uint8_t] in_filter = np.zeros(
+    n_in, dtype=np.uint8
+  )
+  cdef numpy.ndarray[ndim=1, dtype=numpy.uint8_t] bl_filter = np.zeros(
+    n_bl, dtype=np.uint8
+  )
+  cdef numpy.ndarray[ndim=1, dtype=numpy.uint8_t] sp_filter = np.zeros(
+    n_sp, dtype=np.uint8
+  )
+  cdef numpy.ndarray[ndim=1, dtype=numpy.uint8_t] sp_bl_check = np.zeros(
+    n_bl, dtype=np.uint8
+  )
+  cdef numpy.ndarray[ndim=1, dtype=numpy.uint8_t] bl_in_check = np.zeros(
+    n_in, dtype=np.uint8
+  )
+  cdef numpy.uint8_t[::1] _in_filter = in_filter
+  cdef numpy.uint8_t[::1] _bl_filter = bl_filter
+  cdef numpy.uint8_t[::1] _sp_filter = sp_filter
+  cdef numpy.uint8_t[::1] _sp_bl_check = sp_bl_check
+  cdef numpy.uint8_t[::1] _bl_in_check = bl_in_check
+
+  with nogil:
+    # Filter out de-selected bl records
+    for idx in range(n_bl):
+      _bl_filter[idx] = use_bl[idx] and use_in[bl_in_idx[idx]]
+
+    # Filter out de-selected sp records, noting which bl records have good sp records
+    for idx in range(n_sp):
+      if use_sp[idx] and _bl_filter[sp_bl_idx[idx]]:
+        _sp_filter[idx] = 1
+        _sp_bl_check[sp_bl_idx[idx]] = 1
+
+    # Filter out bl records w/o good sp records, noting which in records have good bl
+    for idx in range(n_bl):
+      if _bl_filter[idx] and _sp_bl_check[idx]:
+        _bl_in_check[bl_in_idx[idx]] = 1
+      else:
+        _bl_filter[idx] = 0
+
+    # Filter out in records that have no good bl records
+    for idx in range(n_in):
+      _in_filter[idx] = use_in[idx] and _bl_in_check[idx]
+
+  return in_filter, bl_filter, sp_filter
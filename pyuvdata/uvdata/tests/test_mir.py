@@ -10,6 +10,7 @@ what is used to read the raw binary data into something that the Mir class can
 manipulate into a UVData object.
 """
 import os
+import shutil
 
 import pytest
 import numpy as np
@@ -181,6 +182,60 @@ def test_multi_nchan_spw_read(tmp_path):
         uv_in.write_uvfits(dummyfile, spoof_nonessential=True)
 
 
+def test_read_mir_metadata_only():
+    """
+    Mir metadata-only read test
+
+    Make sure that reading with read_data=False gives the same metadata as a full
+    read, without the data-like arrays.
+    """
+    testfile = os.path.join(DATA_PATH, "sma_test.mir")
+    uv_full = UVData()
+    uv_full.read(testfile)
+
+    uv_meta = UVData()
+    uv_meta.read(testfile, read_data=False)
+
+    assert uv_meta.metadata_only
+    assert uv_meta.data_array is None
+    assert uv_meta.flag_array is None
+    assert uv_meta.nsample_array is None
+
+    uv_full.data_array = None
+    uv_full.flag_array = None
+    uv_full.nsample_array = None
+    assert uv_meta == uv_full
+
+
+def test_read_mir_dropped_in_record(tmp_path):
+    """
+    Mir time check when in records are filtered out
+
+    Make sure that times and LSTs are taken from the right integrations when some of
+    the in records are dropped by the selection (here, an in record with no baselines).
+    """
+    testfile = os.path.join(DATA_PATH, "sma_test.mir")
+    new_testfile = os.path.join(tmp_path, "sma_test_extra_in.mir")
+    shutil.copytree(testfile, new_testfile)
+
+    # Add an extra integration (with no bl records) in front of the real one
+    in_read = mir_parser.MirParser.read_in_data(testfile)
+    extra_in = in_read.copy()
+    extra_in["inhid"] = in_read["inhid"].max() + 1
+    extra_in["mjd"] += 1.0
+    extra_in["lst"] += 1.0
+    np.concatenate((extra_in, in_read)).tofile(os.path.join(new_testfile, "in_read"))
+
+    uv_in = UVData()
+    uv_in.read(testfile)
+
+    uv_extra = UVData()
+    uv_extra.read(new_testfile)
+
+    assert np.array_equal(uv_extra.time_array, uv_in.time_array)
+    assert np.array_equal(uv_extra.lst_array, uv_in.lst_array)
+
+
 def test_read_mir_no_records():
     """
     Mir no-records check
@@ -14,6 +14,7 @@ import os
 import pytest
 import numpy as np
 
+from ... import _mir
 from ...data import DATA_PATH
 from ...uvdata.mir import mir_parser
 
@@ -87,3 +88,321 @@ def test_mir_parser_index_linked(mir_data_object):
     blhid_set = set(np.unique(mir_data.bl_read["blhid"]))
 
     assert set(np.unique(mir_data.sp_read["blhid"])).issubset(blhid_set)
+
+
+def test_mir_parser_unpack_vis(mir_data_object):
+    """
+    Mir visibility unpacking check
+
+    Make sure that the compiled unpacking of the raw data matches what we get from
+    scaling the raw integer values in python.
+    """
+    mir_data = mir_data_object
+
+    for vis, raw, scale_fac in zip(
+        mir_data.vis_data, mir_data.raw_data, mir_data.raw_scale_fac
+    ):
+        check_vis = (np.float32(2.0) ** scale_fac) * raw.astype(np.float32)
+        assert vis.dtype == np.complex64
+        assert np.array_equal(vis, check_vis.view(np.complex64))
+
+
+@pytest.mark.parametrize("scale_exp", [-160, -150, -149, -140, -127, -25, 0, 127, 128])
+def test_mir_parser_unpack_vis_scale_range(scale_exp):
+    """
+    Mir visibility scaling check
+
+    Make sure that spectra are scaled the same way as numpy does it, including for
+    exponents where the scale factor is subnormal, underflows, or overflows.
+    """
+    raw = np.array([1, -2, 3, -32768, 32767, 0], dtype=np.int16)
+    packdata = np.concatenate(([scale_exp], raw)).astype(np.int16)
+
+    vis = _mir.unpack_vis(
+        packdata, np.array([0], dtype=np.int64), np.array([3], dtype=np.int64)
+    )
+    with np.errstate(over="ignore", invalid="ignore"):
+        check_vis = np.power(2.0, scale_exp, dtype=np.float32) * raw.astype(np.float32)
+    assert np.array_equal(vis, check_vis.view(np.complex64), equal_nan=True)
+
+
+@pytest.mark.parametrize("dataoff", [-2, 2 ** 30])
+def test_mir_parser_unpack_vis_bad_dataoff(mir_data_object, dataoff):
+    """
+    Mir visibility unpacking bounds check
+
+    Make sure that an error is raised (rather than reading outside of the record) if
+    the spectra offsets in the metadata point outside of the integration record.
+    """
+    mir_data = mir_data_object
+    sp_data = mir_data.sp_data.copy()
+    sp_data["dataoff"][0] = dataoff
+
+    with pytest.raises(IndexError, match="Some spectra extend past the end"):
+        mir_data.parse_vis_data(mir_data.filepath, mir_data.in_start_dict, sp_data)
+
+    with pytest.raises(ValueError, match="dataoff and nch must have the same length"):
+        _mir.unpack_vis(
+            np.zeros(8, dtype=np.int16),
+            np.zeros(2, dtype=np.int64),
+            np.ones(1, dtype=np.int64),
+        )
+
+
+def test_mir_parser_update_filter(mir_data_object):
+    """
+    Mir filter update check
+
+    Make sure that the filters are only recalculated when the selection changes.
+    """
+    mir_data = mir_data_object
+
+    # Nothing has changed since the data were loaded
+    assert not mir_data._update_filter()
+
+    mir_data.use_sp[0] = False
+    assert mir_data._update_filter()
+    # Filtered records should only get made once they are asked for
+    assert mir_data._sp_data is None
+    assert np.array_equal(mir_data.sp_idx, np.arange(1, len(mir_data.sp_read)))
+    assert len(mir_data.sp_data) == (len(mir_data.sp_read) - 1)
+
+    # Calling again with the same selection shouldn't change anything
+    assert not mir_data._update_filter()
+    assert len(mir_data.sp_data) == (len(mir_data.sp_read) - 1)
+
+    mir_data.use_sp[0] = True
+    assert mir_data._update_filter()
+    assert len(mir_data.sp_data) == len(mir_data.sp_read)
+
+    # Records assigned directly should be kept until the filters change again
+    mir_data.sp_data = mir_data.sp_data[:2]
+    assert len(mir_data.sp_data) == 2
+    assert not mir_data._update_filter()
+    assert len(mir_data.sp_data) == 2
+
+    mir_data.use_sp[0] = False
+    assert mir_data._update_filter()
+    assert len(mir_data.sp_data) == (len(mir_data.sp_read) - 1)
+
+
+@pytest.mark.parametrize("name", ["in", "bl", "sp"])
+def test_mir_parser_update_filter_bad_len(mir_data_object, name):
+    """
+    Mir filter length check
+
+    Make sure that an error is raised if the selection arrays don't match the records.
+    """
+    mir_data = mir_data_object
+    setattr(mir_data, "use_" + name, getattr(mir_data, "use_" + name)[:-1])
+
+    with pytest.raises(ValueError, match=f"use_{name} must have the same length"):
+        mir_data._update_filter()
+
+
+def test_mir_parser_writeable_records(mir_data_object):
+    """
+    Mir record writeability check
+
+    Make sure that the filtered records are copies of the metadata, and that changing
+    the metadata doesn't change the file on disk.
+    """
+    mir_data = mir_data_object
+    inhid = mir_data.in_read["inhid"][0]
+
+    mir_data.in_data["inhid"][0] = -1
+    assert mir_data.in_read["inhid"][0] == inhid
+
+    mir_data.in_read["inhid"][0] = -1
+    new_mir_data = mir_parser.MirParser(mir_data.filepath)
+    assert new_mir_data.in_read["inhid"][0] == inhid
+
+
+def test_mir_parser_match_keys():
+    """
+    Mir key matching check
+
+    Make sure that child records are matched to the right parent records, and that
+    an error is raised if a child record has no parent.
+    """
+    parent_keys = np.array([5, 3, 9, 1])
+    child_keys = np.array([9, 9, 1, 5, 3])
+
+    parent_idx = mir_parser._match_keys(parent_keys, child_keys)
+    assert np.array_equal(parent_keys[parent_idx], child_keys)
+
+    # Supplying the sort order should give the same answer
+    assert np.array_equal(
+        mir_parser._match_keys(parent_keys, child_keys, np.argsort(parent_keys)),
+        parent_idx,
+    )
+
+    with pytest.raises(KeyError, match="Some child records do not have a matching"):
+        mir_parser._match_keys(parent_keys, np.array([5, 4]))
+
+    with pytest.raises(KeyError, match="Some child records do not have a matching"):
+        mir_parser._match_keys(parent_keys, np.array([10]))
+
+    # No parents at all should also raise a KeyError, unless there are no children
+    with pytest.raises(KeyError, match="Some child records do not have a matching"):
+        mir_parser._match_keys(np.array([], dtype=np.int32), np.array([3]))
+
+    assert len(mir_parser._match_keys(np.array([]), np.array([], dtype=int))) == 0
+
+
+def test_mir_parser_scan_int_headers():
+    """
+    Mir integration header scanning check
+
+    Make sure that the compiled header scanner finds each record in a mock "sch_read"
+    buffer, and errors if it finds a record with a nonsensical size.
+    """
+    records = [(3, 4), (7, 0), (9, 12)]
+    filedata = b"".join(
+        np.array(rec, dtype=np.int32).tobytes() + bytes(rec[1]) for rec in records
+    )
+
+    inhid, insize, offset = _mir.scan_int_headers(np.frombuffer(filedata, np.uint8))
+    assert np.array_equal(inhid, [3, 7, 9])
+    assert np.array_equal(insize, [4, 0, 12])
+    assert np.array_equal(offset, [0, 12, 20])
+
+    filedata = np.array([1, -4], dtype=np.int32).tobytes()
+    with pytest.raises(ValueError, match="Found a record with a negative size"):
+        _mir.scan_int_headers(np.frombuffer(filedata, np.uint8))
+
+
+def test_mir_parser_group_by_inhid():
+    """
+    Mir inhid grouping check
+
+    Make sure that records are grouped by inhid, keeping their original order within
+    each group.
+    """
+    inhid_arr = np.array([4, 2, 4, 7, 2, 4])
+
+    unique_inhid, inhid_order, group_start, group_end = mir_parser._group_by_inhid(
+        inhid_arr
+    )
+    assert np.array_equal(unique_inhid, [2, 4, 7])
+    groups = [
+        inhid_order[start:end].tolist() for start, end in zip(group_start, group_end)
+    ]
+    assert groups == [[1, 4], [0, 2, 5], [3]]
+
+    # Check that empty arrays are handled okay
+    for item in mir_parser._group_by_inhid(np.array([], dtype=np.int32)):
+        assert len(item) == 0
+
+
+def test_mir_parser_apply_filters():
+    """
+    Mir filter propagation check
+
+    Make sure that selections are correctly propagated between in, bl, and sp records.
+    """
+    bl_in_idx = np.array([0, 0, 1], dtype=np.int64)
+    sp_bl_idx = np.array([0, 1, 1, 2], dtype=np.int64)
+    use_in = np.array([1, 1], dtype=np.uint8)
+    use_bl = np.array([1, 1, 1], dtype=np.uint8)
+    use_sp = np.array([0, 1, 1, 1], dtype=np.uint8)
+
+    # The first bl record has no good sp records, so should be dropped
+    in_filter, bl_filter, sp_filter = _mir.apply_filters(
+        use_in, use_bl, use_sp, bl_in_idx, sp_bl_idx
+    )
+    assert np.array_equal(in_filter, [1, 1])
+    assert np.array_equal(bl_filter, [0, 1, 1])
+    assert np.array_equal(sp_filter, [0, 1, 1, 1])
+
+    # Dropping the last bl record should take out its sp and in records as well
+    use_bl[2] = 0
+    in_filter, bl_filter, sp_filter = _mir.apply_filters(
+        use_in, use_bl, use_sp, bl_in_idx, sp_bl_idx
+    )
+    assert np.array_equal(in_filter, [1, 0])
+    assert np.array_equal(bl_filter, [0, 1, 0])
+    assert np.array_equal(sp_filter, [0, 1, 1, 0])
+
+    with pytest.raises(ValueError, match="use_bl and bl_in_idx must have the same"):
+        _mir.apply_filters(use_in, use_bl[:-1], use_sp, bl_in_idx, sp_bl_idx)
+
+    with pytest.raises(ValueError, match="use_sp and sp_bl_idx must have the same"):
+        _mir.apply_filters(use_in, use_bl, use_sp[:-1], bl_in_idx, sp_bl_idx)
+
+
+def test_mir_parser_inhid_to_idx(mir_data_object):
+    """
+    Mir inhid lookup check
+
+    Make sure that inhid values are mapped to the right positions within in_data,
+    and that the lookup follows changes in the filters.
+    """
+    mir_data = mir_data_object
+    in_inhid = mir_data.in_data["inhid"]
+
+    assert np.array_equal(
+        mir_data.inhid_to_idx(in_inhid[::-1]), np.arange(len(in_inhid))[::-1]
+    )
+    assert mir_data.inhid_to_idx(in_inhid[0]) == 0
+    assert mir_data.inhid_dict == {key: idx for idx, key in enumerate(in_inhid)}
+
+    with pytest.raises(KeyError, match="Some values of inhid are not found"):
+        mir_data.inhid_to_idx(np.max(in_inhid) + 1)
+
+    mir_data.use_in[0] = False
+    mir_data._update_filter()
+    with pytest.raises(KeyError, match="Some values of inhid are not found"):
+        mir_data.inhid_to_idx(in_inhid[0])
+    assert len(mir_data.inhid_dict) == (len(in_inhid) - 1)
+
+
+def test_mir_parser_inhid_to_idx_sparse(mir_data_object):
+    """
+    Mir sparse inhid lookup check
+
+    Make sure that widely spaced inhid values are still looked up correctly (without
+    making an enormous lookup array).
+    """
+    mir_data = mir_data_object
+    # The test file only has one integration, so add a second, far-away one
+    mir_data.in_read = np.concatenate([mir_data.in_read, mir_data.in_read])
+    mir_data.in_read["inhid"][-1] = 2 ** 30
+    mir_data.in_idx = np.arange(len(mir_data.in_read))
+    mir_data._inhid_lookup = None
+    in_inhid = mir_data.in_read["inhid"]
+
+    assert np.array_equal(
+        mir_data.inhid_to_idx(in_inhid[::-1]), np.arange(len(in_inhid))[::-1]
+    )
+    assert mir_data.inhid_to_idx(in_inhid[-1]) == (len(in_inhid) - 1)
+    assert mir_data._inhid_lookup[0] is None
+
+    with pytest.raises(KeyError, match="Some values of inhid are not found"):
+        mir_data.inhid_to_idx(2 ** 30 + 1)
+
+
+@pytest.mark.parametrize("n_threads", [1, 2, 3])
+def test_mir_parser_read_auto_data_threads(mir_data_object, n_threads):
+    """
+    Mir auto-correlation reading check
+
+    Make sure that reading the autos gives the same answer regardless of the number of
+    threads used, and whether or not the records are all the same size.
+    """
+    mir_data = mir_data_object
+    winsel = [1, 4]
+    check_data = mir_data.read_auto_data(mir_data.filepath, mir_data.ac_data, winsel)
+
+    auto_data = mir_data.read_auto_data(
+        mir_data.filepath, mir_data.ac_data, winsel, n_threads=n_threads
+    )
+    assert np.array_equal(auto_data, check_data, equal_nan=True)
+
+    # Tweaking the record size forces the record-by-record read
+    ac_data = mir_data.ac_data.copy()
+    ac_data["datasize"][0] += 1
+    auto_data = mir_data.read_auto_data(
+        mir_data.filepath, ac_data, winsel, n_threads=n_threads
+    )
+    assert np.array_equal(auto_data, check_data, equal_nan=True)
@@ -1228,17 +1228,14 @@ def test_read_write_read_miriad_partial_metadata_only(uv_in_paper, tmp_path):
 
 @pytest.mark.filterwarnings("ignore:Telescope EVLA is not")
 @pytest.mark.filterwarnings("ignore:The uvw_array does not match the expected values")
-def test_read_ms_write_miriad_casa_history(tmp_path):
+def test_read_ms_write_miriad_casa_history(nrao_ms, tmp_path):
     """
     Read in .ms file.
     Write to a miriad file, read back in and check for history parameter
     """
-    pytest.importorskip("casacore")
-    ms_uv = UVData()
+    ms_uv = nrao_ms
     miriad_uv = UVData()
-    ms_file = os.path.join(DATA_PATH, "day2_TDEM0003_10s_norx_1src_1spw.ms")
     testfile = os.path.join(tmp_path, "outtest_miriad")
-    ms_uv.read(ms_file)
 
     ms_uv.write_miriad(testfile, clobber=True)
     miriad_uv.read(testfile)
@@ -7,7 +7,7 @@
 """
 import pytest
 import os
-import shutil
+import tarfile
 import numpy as np
 
 from pyuvdata import UVData
@@ -17,63 +17,80 @@ from ..uvfits import UVFITS
 
 pytest.importorskip("casacore")
 
+nrao_ms_file = os.path.join(DATA_PATH, "day2_TDEM0003_10s_norx_1src_1spw.ms")
+cotter_ms_file = os.path.join(DATA_PATH, "1102865728_small.ms")
+
+
+def _extract_ms_tarball(tarball, tmp_path_factory):
+    """Extract a tarred ms file into a temporary directory, return the ms path."""
+    tmp_dir = str(tmp_path_factory.mktemp("ms_tarball"))
+    with tarfile.open(os.path.join(DATA_PATH, tarball)) as tf:
+        new_filename = os.path.join(tmp_dir, tf.getnames()[0])
+        tf.extractall(path=tmp_dir)
+
+    return new_filename
+
+
+_UVFITS_REQ_EXTRA = frozenset(UVFITS.uvfits_required_extra)
+
+
+def _reconcile_extras(uvfits_uv, ms_uv):
+    """Unset uvfits-required extra parameters on uvfits_uv that ms_uv does not set."""
+    for p in uvfits_uv.extra():
+        fits_param = getattr(uvfits_uv, p)
+        if fits_param.name in _UVFITS_REQ_EXTRA and getattr(ms_uv, p).value is None:
+            fits_param.value = None
+            setattr(uvfits_uv, p, fits_param)
+
 
 @pytest.fixture(scope="session")
-def nrao_uv():
-    uvobj = UVData()
-    testfile = os.path.join(DATA_PATH, "day2_TDEM0003_10s_norx_1src_1spw.ms")
-    uvobj.read(testfile)
+def lwa_ms_file(tmp_path_factory):
+    """Extract the LWA ms file once per session."""
+    return _extract_ms_tarball("lwasv_cor_58342_05_00_14.ms.tar.gz", tmp_path_factory)
 
-    yield uvobj
 
-    del uvobj
+@pytest.fixture(scope="session")
+def extra_pol_ms_file(tmp_path_factory):
+    """Extract the ms file with extra polarization setups once per session."""
+    return _extract_ms_tarball(
+        "X5707_1spw_1scan_10chan_1time_1bl_noatm.ms.tar.gz", tmp_path_factory
+    )
 
 
 def test_cotter_ms():
     """Test reading in an ms made from MWA data with cotter (no dysco compression)"""
     uvobj = UVData()
-    testfile = os.path.join(DATA_PATH, "1102865728_small.ms")
-    uvobj.read(testfile)
+    uvobj.read(cotter_ms_file)
 
     # check that a select on read works
+    freq_chans = np.arange(2)
     uvobj2 = UVData()
     with uvtest.check_warnings(UserWarning, "Warning: select on read keyword set"):
-        uvobj2.read(testfile, freq_chans=np.arange(2))
-    uvobj.select(freq_chans=np.arange(2))
+        uvobj2.read(cotter_ms_file, freq_chans=freq_chans)
+    uvobj.select(freq_chans=freq_chans)
     assert uvobj == uvobj2
-    del uvobj
 
 
 @pytest.mark.filterwarnings("ignore:The uvw_array does not match the expected values")
-def test_read_nrao(nrao_uv):
+def test_read_nrao(nrao_ms):
     """Test reading in a CASA tutorial ms file."""
-    uvobj = nrao_uv
+    uvobj = nrao_ms
     expected_extra_keywords = ["DATA_COL"]
 
     assert sorted(expected_extra_keywords) == sorted(uvobj.extra_keywords.keys())
 
 
 @pytest.mark.filterwarnings("ignore:The uvw_array does not match the expected values")
-def test_read_lwa():
+def test_read_lwa(lwa_ms_file):
     """Test reading in an LWA ms file."""
     uvobj = UVData()
-    testfile = os.path.join(DATA_PATH, "lwasv_cor_58342_05_00_14.ms.tar.gz")
     expected_extra_keywords = ["DATA_COL"]
 
-    import tarfile
-
-    with tarfile.open(testfile) as tf:
-        new_filename = os.path.join(DATA_PATH, tf.getnames()[0])
-        tf.extractall(path=DATA_PATH)
-
-    uvobj.read(new_filename, file_type="ms")
+    uvobj.read(lwa_ms_file, file_type="ms")
     assert sorted(expected_extra_keywords) == sorted(uvobj.extra_keywords.keys())
 
     assert uvobj.history == uvobj.pyuvdata_version_str
 
-    # delete the untarred folder
-    shutil.rmtree(new_filename)
-
 
 @pytest.mark.filterwarnings("ignore:The uvw_array does not match the expected values")
 def test_no_spw():
@@ -81,7 +98,6 @@ def test_no_spw():
     uvobj = UVData()
     testfile_no_spw = os.path.join(DATA_PATH, "zen.2456865.60537.xy.uvcRREAAM.ms")
     uvobj.read(testfile_no_spw)
-    del uvobj
 
 
 def test_spwnotsupported():
@@ -89,7 +105,6 @@ def test_spwnotsupported():
     uvobj = UVData()
     testfile = os.path.join(DATA_PATH, "day2_TDEM0003_10s_norx_1scan.ms")
     pytest.raises(ValueError, uvobj.read, testfile)
-    del uvobj
 
 
 def test_multi_len_spw():
@@ -102,28 +117,15 @@ def test_multi_len_spw():
 
 
 @pytest.mark.filterwarnings("ignore:The uvw_array does not match the expected values")
-def test_extra_pol_setup():
+def test_extra_pol_setup(extra_pol_ms_file):
     """Test reading in an ms file with extra polarization setups (not used in data)."""
     uvobj = UVData()
-    testfile = os.path.join(
-        DATA_PATH, "X5707_1spw_1scan_10chan_1time_1bl_noatm.ms.tar.gz"
-    )
-
-    import tarfile
-
-    with tarfile.open(testfile) as tf:
-        new_filename = os.path.join(DATA_PATH, tf.getnames()[0])
-        tf.extractall(path=DATA_PATH)
-
-    uvobj.read(new_filename, file_type="ms")
-
-    # delete the untarred folder
-    shutil.rmtree(new_filename)
+    uvobj.read(extra_pol_ms_file, file_type="ms")
 
 
 @pytest.mark.filterwarnings("ignore:Telescope EVLA is not in known_telescopes.")
 @pytest.mark.filterwarnings("ignore:The uvw_array does not match the expected values")
-def test_read_ms_read_uvfits(nrao_uv, casa_uvfits):
+def test_read_ms_read_uvfits(nrao_ms, casa_uvfits):
     """
     Test that a uvdata object instantiated from an ms file created with CASA's
     importuvfits is equal to a uvdata object instantiated from the original
@@ -131,8 +133,8 @@ def test_read_ms_read_uvfits(nrao_uv, casa_uvfits):
     Since the histories are different, this test sets both uvdata
     histories to identical empty strings before comparing them.
     """
-    ms_uv = nrao_uv.copy()
-    uvfits_uv = casa_uvfits.copy()
+    ms_uv = nrao_ms
+    uvfits_uv = casa_uvfits
     # set histories to identical blank strings since we do not expect
     # them to be the same anyways.
     ms_uv.history = ""
@@ -148,51 +150,42 @@ def test_read_ms_read_uvfits(nrao_uv, casa_uvfits):
     # set those parameters to none to check that the rest of the objects match
     ms_uv.antenna_diameters = None
 
-    for p in uvfits_uv.extra():
-        fits_param = getattr(uvfits_uv, p)
-        ms_param = getattr(ms_uv, p)
-        if fits_param.name in UVFITS.uvfits_required_extra and ms_param.value is None:
-            fits_param.value = None
-            setattr(uvfits_uv, p, fits_param)
+    _reconcile_extras(uvfits_uv, ms_uv)
 
     # extra keywords are also different, set both to empty dicts
     uvfits_uv.extra_keywords = {}
     ms_uv.extra_keywords = {}
 
     assert uvfits_uv == ms_uv
-    del ms_uv
-    del uvfits_uv
 
 
 @pytest.mark.filterwarnings("ignore:Telescope EVLA is not in known_telescopes.")
 @pytest.mark.filterwarnings("ignore:The uvw_array does not match the expected values")
-def test_read_ms_write_uvfits(nrao_uv, tmp_path):
+def test_read_ms_write_uvfits(nrao_ms, tmp_path):
     """
     read ms, write uvfits test.
     Read in ms file, write out as uvfits, read back in and check for
     object equality.
     """
-    ms_uv = nrao_uv
+    ms_uv = nrao_ms
     uvfits_uv = UVData()
     testfile = str(tmp_path / "outtest.uvfits")
     ms_uv.write_uvfits(testfile, spoof_nonessential=True)
     uvfits_uv.read(testfile)
 
     assert uvfits_uv == ms_uv
-    del ms_uv
-    del uvfits_uv
 
 
 @pytest.mark.filterwarnings("ignore:Telescope EVLA is not in known_telescopes.")
 @pytest.mark.filterwarnings("ignore:The uvw_array does not match the expected values")
-def test_read_ms_write_miriad(nrao_uv, tmp_path):
+def test_read_ms_write_miriad(nrao_ms, tmp_path):
     """
     read ms, write miriad test.
     Read in ms file, write out as miriad, read back in and check for
     object equality.
     """
     pytest.importorskip("pyuvdata._miriad")
-    ms_uv = nrao_uv
+    ms_uv = nrao_ms
     miriad_uv = UVData()
     testfile = str(tmp_path / "outtest_miriad")
     ms_uv.write_miriad(testfile, clobber=True)
@@ -208,7 +201,7 @@ def test_multi_files(casa_uvfits, axis):
     """
     Reading multiple files at once.
     """
-    uv_full = casa_uvfits.copy()
+    uv_full = casa_uvfits
 
     uv_multi = UVData()
     testfile1 = os.path.join(DATA_PATH, "multi_1.ms")
@@ -233,20 +226,13 @@ def test_multi_files(casa_uvfits, axis):
     # set those parameters to none to check that the rest of the objects match
     uv_multi.antenna_diameters = None
 
-    for p in uv_full.extra():
-        fits_param = getattr(uv_full, p)
-        ms_param = getattr(uv_multi, p)
-        if fits_param.name in UVFITS.uvfits_required_extra and ms_param.value is None:
-            fits_param.value = None
-            setattr(uv_full, p, fits_param)
+    _reconcile_extras(uv_full, uv_multi)
 
     # extra keywords are also different, set both to empty dicts
     uv_full.extra_keywords = {}
     uv_multi.extra_keywords = {}
 
     assert uv_multi == uv_full
-    del uv_full
-    del uv_multi
 
 
 def test_bad_col_name():
@@ -254,7 +240,6 @@ def test_bad_col_name():
     Test error with invalid column name.
     """
     uvobj = UVData()
-    testfile = os.path.join(DATA_PATH, "day2_TDEM0003_10s_norx_1src_1spw.ms")
 
     with pytest.raises(ValueError, match="Invalid data_column value supplied"):
-        uvobj.read_ms(testfile, data_column="FOO")
+        uvobj.read_ms(nrao_ms_file, data_column="FOO")
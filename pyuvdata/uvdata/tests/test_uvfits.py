@@ -936,17 +936,14 @@ def test_multi_phase_on_read(casa_uvfits, tmp_path):
 
 @pytest.mark.filterwarnings("ignore:The uvw_array does not match the expected values")
 @pytest.mark.filterwarnings("ignore:Telescope EVLA is not")
-def test_read_ms_write_uvfits_casa_history(tmp_path):
+def test_read_ms_write_uvfits_casa_history(nrao_ms, tmp_path):
     """
     read in .ms file.
     Write to a uvfits file, read back in and check for casa_history parameter
     """
-    pytest.importorskip("casacore")
-    ms_uv = UVData()
+    ms_uv = nrao_ms
     uvfits_uv = UVData()
-    ms_file = os.path.join(DATA_PATH, "day2_TDEM0003_10s_norx_1src_1spw.ms")
     testfile = str(tmp_path / "outtest.uvfits")
-    ms_uv.read_ms(ms_file)
     ms_uv.write_uvfits(testfile, spoof_nonessential=True)
     uvfits_uv.read(testfile)
     assert ms_uv == uvfits_uv
@@ -6143,6 +6143,7 @@ class UVData(UVBase):
         isb=None,
         corrchunk=None,
         pseudo_cont=False,
+        read_data=True,
     ):
         """
         Read in data from an SMA MIR file.
@@ -6166,6 +6167,10 @@ class UVData(UVBase):
             Correlator chunk code for MIR dataset
         pseudo_cont : boolean
             Read in only pseudo-continuuum values. Default is false.
+        read_data : bool
+            Read in the visibility and flag data. If set to false, only the
+            metadata will be read in. Setting read_data to False results in a
+            metadata only object. Default is True.
         """
         from . import mir
 
@@ -6177,6 +6182,7 @@ class UVData(UVBase):
             isb=isb,
             corrchunk=corrchunk,
             pseudo_cont=pseudo_cont,
+            read_data=read_data,
         )
         self._convert_from_filetype(mir_obj)
         del mir_obj
@@ -7039,7 +7045,7 @@ class UVData(UVBase):
             that do not have data associated with them after the select option.
         read_data : bool
             Read in the data. Only used if file_type is 'uvfits',
-            'miriad' or 'uvh5'. If set to False, only the metadata will be
+            'miriad', 'mir' or 'uvh5'. If set to False, only the metadata will be
             read in. Setting read_data to False results in a metdata only
             object.
         phase_type : str, optional
@@ -7535,6 +7541,7 @@ class UVData(UVBase):
                     isb=isb,
                     corrchunk=corrchunk,
                     pseudo_cont=pseudo_cont,
+                    read_data=read_data,
                 )
                 select = False
 
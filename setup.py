@@ -97,6 +97,13 @@ corr_fits_extension = Extension(
     extra_compile_args=extra_compile_args,
 )
 
+mir_extension = Extension(
+    "pyuvdata._mir",
+    sources=["pyuvdata/uvdata/mir_src/mir.pyx"],
+    define_macros=global_c_macros,
+    extra_compile_args=extra_compile_args,
+)
+
 utils_extension = Extension(
     "pyuvdata._utils",
     sources=["pyuvdata/utils.pyx"],
@@ -104,7 +111,7 @@ utils_extension = Extension(
     extra_compile_args=extra_compile_args,
 )
 
-extensions = [corr_fits_extension, utils_extension]
+extensions = [corr_fits_extension, mir_extension, utils_extension]
 
 # don't build miriad on windows
 if not is_platform_windows():